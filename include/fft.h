@@ -25,6 +25,7 @@
 void realfft_split(MYFLT *data, MYFLT *outdata, int n, MYFLT **twiddle);
 void irealfft_split(MYFLT *data, MYFLT *outdata, int n, MYFLT **twiddle);
 void fft_compute_split_twiddle(MYFLT **twiddle, int size);
+MYFLT ** fft_get_shared_twiddle(int size);
 void fft_compute_window(MYFLT *window, int size, int wintype);
 /* in-place radix-2 real fft (not used actually) */
 void realfft_packed(MYFLT *data, MYFLT *outdata, int size, MYFLT *twiddle);
@@ -451,6 +451,7 @@ extern PyTypeObject PVSynthType;
 extern PyTypeObject PVTransposeType;
 extern PyTypeObject PVVerbType;
 extern PyTypeObject PVGateType;
+extern PyTypeObject PVChainType;
 extern PyTypeObject PVAddSynthType;
 extern PyTypeObject PVCrossType;
 extern PyTypeObject PVMultType;
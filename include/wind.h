@@ -34,4 +34,5 @@
 #ifndef _WIND_
 #define _WIND_
 void gen_window(MYFLT *window, int size, int wintype);
+MYFLT * gen_get_shared_window(int size, int wintype);
 #endif
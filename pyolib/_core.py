@@ -162,6 +162,9 @@ def pyoArgsAssert(obj, format, *args):
         elif f == "i":
             if argtype not in [ListType, IntType, LongType]:
                 expected = "integer"
+        elif f == "j":
+            if argtype not in [ListType, TupleType, IntType, LongType]:
+                expected = "integer or sequence of integers"
         elif f == "I":
             if argtype not in [IntType, LongType]:
                 expected = "integer - list not allowed"
@@ -420,6 +423,13 @@ class PyoObjectBase(object):
     # descriptions of the object. Subclasses need to set this.
     _STREAM_TYPE = ''
 
+    # Declared here so that subclasses may declare their own __slots__ to
+    # drop the per-instance dict. Subclasses that don't declare __slots__
+    # keep a dict as usual. The __weakref__ slot keeps slotted instances
+    # weak-referenceable, which WeakMethod relies on for callbacks like
+    # Pattern(obj.play).
+    __slots__ = ('__weakref__',)
+
     def __init__(self):
         if not serverCreated():
             raise PyoServerStateException("You must create and boot a Server before creating any audio object.")
@@ -558,6 +568,11 @@ class PyoObject(PyoObjectBase):
 
     _STREAM_TYPE = 'audio'
 
+    # Attributes managed by this class. Declared so that subclasses with
+    # their own __slots__ can avoid the per-instance dict entirely.
+    __slots__ = ('_target_dict', '_signal_dict', '_keep_trace', '_mul', '_add',
+                 '_op_duplicate', '_map_list', '_zeros', '_shuffle_indexes')
+
     def __init__(self, mul=1.0, add=0.0):
         PyoObjectBase.__init__(self)
         self._target_dict = {}
@@ -568,6 +583,7 @@ class PyoObject(PyoObjectBase):
         self._op_duplicate = 1
         self._map_list = []
         self._zeros = None
+        self._shuffle_indexes = []
 
     def __add__(self, x):
         x, lmax = convertArgsToLists(x)
@@ -812,7 +828,11 @@ class PyoObject(PyoObjectBase):
 
         """
         pyoArgsAssert(self, "nn", dur, delay)
-        dur, delay, lmax = convertArgsToLists(dur, delay)
+        if dur == 0 and delay == 0:
+            dur = delay = [0]
+            lmax = 1
+        else:
+            dur, delay, lmax = convertArgsToLists(dur, delay)
         if hasattr(self, "_trig_objs"):
             if type(self._trig_objs) == ListType:
                 for i in range(lmax):
@@ -821,8 +841,8 @@ class PyoObject(PyoObjectBase):
             else:
                 self._trig_objs.play(dur, delay)
         if hasattr(self, "_base_players"):
-            [obj.play(wrap(dur,i), wrap(delay,i)) for i, obj in enumerate(self._base_players)]
-        [obj.play(wrap(dur,i), wrap(delay,i)) for i, obj in enumerate(self._base_objs)]
+            batch_play(self._base_players, dur, delay)
+        batch_play(self._base_objs, dur, delay)
         return self
 
     def out(self, chnl=0, inc=1, dur=0, delay=0):
@@ -852,12 +872,16 @@ class PyoObject(PyoObjectBase):
         the output number by `inc` and wrap around the global number of
         channels. Then, the list of streams is scrambled.
 
-        If `chnl` is a list, successive values in the list will be
-        assigned to successive streams.
+        If `chnl` is a list or a tuple, successive values in the sequence
+        will be assigned to successive streams.
 
         """
-        pyoArgsAssert(self, "iInn", chnl, inc, dur, delay)
-        dur, delay, lmax = convertArgsToLists(dur, delay)
+        pyoArgsAssert(self, "jInn", chnl, inc, dur, delay)
+        if dur == 0 and delay == 0:
+            dur = delay = [0]
+            lmax = 1
+        else:
+            dur, delay, lmax = convertArgsToLists(dur, delay)
         if hasattr(self, "_trig_objs"):
             if type(self._trig_objs) == ListType:
                 for i in range(lmax):
@@ -866,16 +890,45 @@ class PyoObject(PyoObjectBase):
             else:
                 self._trig_objs.play(dur, delay)
         if hasattr(self, "_base_players"):
-            [obj.play(wrap(dur,i), wrap(delay,i)) for i, obj in enumerate(self._base_players)]
-        if type(chnl) == ListType:
-            [obj.out(wrap(chnl,i), wrap(dur,i), wrap(delay,i)) for i, obj in enumerate(self._base_objs)]
+            batch_play(self._base_players, dur, delay)
+        if isinstance(chnl, (list, tuple)):
+            if isinstance(chnl, tuple):
+                chnl = list(chnl)
+            batch_out_list(self._base_objs, chnl, dur, delay)
         else:
             if chnl < 0:
-                [obj.out(i*inc, wrap(dur,i), wrap(delay,i)) for i, obj in enumerate(random.sample(self._base_objs, len(self._base_objs)))]
+                if len(self._shuffle_indexes) != len(self._base_objs):
+                    self._shuffle_indexes = range(len(self._base_objs))
+                random.shuffle(self._shuffle_indexes)
+                [self._base_objs[k].out(i*inc, wrap(dur,i), wrap(delay,i)) for i, k in enumerate(self._shuffle_indexes)]
             else:
-                [obj.out(chnl+i*inc, wrap(dur,i), wrap(delay,i)) for i, obj in enumerate(self._base_objs)]
+                batch_out(self._base_objs, chnl, inc, dur, delay)
         return self
 
+    def out_batch(self, channels, dur=0, delay=0):
+        """
+        Start processing and send each audio stream to the physical
+        output given at the same position in `channels`.
+
+        All channel assignments are submitted in a single C call.
+        This method returns `self`, allowing it to be applied at the
+        object creation.
+
+        :Args:
+
+            channels : list or tuple of ints
+                Physical outputs assigned to successive audio streams of
+                the object, wrapped around the sequence length.
+            dur : float, optional
+                Duration, in seconds, of the object's activation. The default is 0
+                and means infinite duration.
+            delay : float, optional
+                Delay, in seconds, before the object's activation. Defaults to 0.
+
+        """
+        pyoArgsAssert(self, "xnn", channels, dur, delay)
+        return self.out(channels, 1, dur, delay)
+
     def stop(self):
         """
         Stop processing.
@@ -886,12 +939,12 @@ class PyoObject(PyoObjectBase):
         """
         if hasattr(self, "_trig_objs"):
             if type(self._trig_objs) == ListType:
-                [obj.stop() for obj in self._trig_objs]
+                batch_stop(self._trig_objs)
             else:
                 self._trig_objs.stop()
         if hasattr(self, "_base_players"):
-            [obj.stop() for obj in self._base_players]
-        [obj.stop() for obj in self._base_objs]
+            batch_stop(self._base_players)
+        batch_stop(self._base_objs)
         return self
 
     def mix(self, voices=1):
@@ -24,6 +24,7 @@ You should have received a copy of the GNU Lesser General Public
 License along with pyo.  If not, see <http://www.gnu.org/licenses/>.
 """
 import sys, random
+from operator import methodcaller
 from _core import *
 from _maps import *
 from types import SliceType
@@ -47,6 +48,10 @@ class Pan(PyoObject):
         spread : float or PyoObject
             Amount of sound leaking to the surrounding channels,
             between 0 and 1. Defaults to 0.5.
+        in_fader : InputFader, optional
+            Already created InputFader to share with other panner objects
+            reading the same source. If None, a private one is created.
+            Defaults to None.
 
     >>> s = Server(nchnls=2).boot()
     >>> s.start()
@@ -55,20 +60,48 @@ class Pan(PyoObject):
     >>> p = Pan(a, outs=2, pan=lfo).out()
 
     """
-    def __init__(self, input, outs=2, pan=0.5, spread=0.5, mul=1, add=0):
+    __slots__ = ('_input', '_pan', '_outs', '_spread', '_in_fader', '_owns_fader',
+                 '_ctor_args', '_base_players_real', '_base_objs_real')
+
+    def __init__(self, input, outs=2, pan=0.5, spread=0.5, mul=1, add=0, in_fader=None):
         pyoArgsAssert(self, "oIOOOO", input, outs, pan, spread, mul, add)
         PyoObject.__init__(self, mul, add)
         self._input = input
         self._pan = pan
         self._outs = outs
         self._spread = spread
-        self._in_fader = InputFader(input)
+        self._owns_fader = in_fader is None
+        if in_fader is None:
+            self._in_fader = InputFader(input)
+        else:
+            self._in_fader = in_fader
         in_fader, pan, spread, mul, add, lmax = convertArgsToLists(self._in_fader, pan, spread, mul, add)
-        self._base_players = [Panner_base(wrap(in_fader,i), outs, wrap(pan,i), wrap(spread,i)) for i in range(lmax)]
-        self._base_objs = []
+        # C streams are built on first access (play, out, indexing, ...),
+        # so a graph that is set up and torn down without being used
+        # never allocates them.
+        self._ctor_args = (in_fader, pan, spread, mul, add, lmax)
+        self._base_players_real = None
+        self._base_objs_real = None
+
+    def _materialize(self):
+        in_fader, pan, spread, mul, add, lmax = self._ctor_args
+        self._base_players_real = [Panner_base(wrap(in_fader,i), self._outs, wrap(pan,i), wrap(spread,i)) for i in range(lmax)]
+        self._base_objs_real = []
         for i in range(lmax):
-            for j in range(outs):
-                self._base_objs.append(Pan_base(wrap(self._base_players,i), j, wrap(mul,i), wrap(add,i)))
+            for j in range(self._outs):
+                self._base_objs_real.append(Pan_base(wrap(self._base_players_real,i), j, wrap(mul,i), wrap(add,i)))
+
+    @property
+    def _base_players(self):
+        if self._base_players_real is None:
+            self._materialize()
+        return self._base_players_real
+
+    @property
+    def _base_objs(self):
+        if self._base_objs_real is None:
+            self._materialize()
+        return self._base_objs_real
 
     def setInput(self, x, fadetime=0.05):
         """
@@ -83,6 +116,9 @@ class Pan(PyoObject):
 
         """
         pyoArgsAssert(self, "oN", x, fadetime)
+        if not self._owns_fader:
+            print >> sys.stderr, "%s: setInput is ignored when the InputFader is shared." % self.__class__.__name__
+            return
         self._input = x
         self._in_fader.setInput(x, fadetime)
 
@@ -98,8 +134,11 @@ class Pan(PyoObject):
         """
         pyoArgsAssert(self, "O", x)
         self._pan = x
-        x, lmax = convertArgsToLists(x)
-        [obj.setPan(wrap(x,i)) for i, obj in enumerate(self._base_players)]
+        if type(x) in [IntType, LongType, FloatType]:
+            map(methodcaller("setPan", x), self._base_players)
+        else:
+            x, lmax = convertArgsToLists(x)
+            batch_call(self._base_players, "setPan", x)
 
     def setSpread(self, x):
         """
@@ -113,8 +152,11 @@ class Pan(PyoObject):
         """
         pyoArgsAssert(self, "O", x)
         self._spread = x
-        x, lmax = convertArgsToLists(x)
-        [obj.setSpread(wrap(x,i)) for i, obj in enumerate(self._base_players)]
+        if type(x) in [IntType, LongType, FloatType]:
+            map(methodcaller("setSpread", x), self._base_players)
+        else:
+            x, lmax = convertArgsToLists(x)
+            batch_call(self._base_players, "setSpread", x)
 
     def ctrl(self, map_list=None, title=None, wxnoserver=False):
         self._map_list = [SLMapPan(self._pan),
@@ -159,6 +201,10 @@ class SPan(PyoObject):
         pan : float or PyoObject
             Position of the sound on the panning circle, between 0 and 1.
             Defaults to 0.5.
+        in_fader : InputFader, optional
+            Already created InputFader to share with other panner objects
+            reading the same source. If None, a private one is created.
+            Defaults to None.
 
     >>> s = Server(nchnls=2).boot()
     >>> s.start()
@@ -167,19 +213,44 @@ class SPan(PyoObject):
     >>> p = SPan(a, outs=2, pan=lfo).out()
 
     """
-    def __init__(self, input, outs=2, pan=0.5, mul=1, add=0):
+    __slots__ = ('_input', '_outs', '_pan', '_in_fader', '_owns_fader',
+                 '_ctor_args', '_base_players_real', '_base_objs_real')
+
+    def __init__(self, input, outs=2, pan=0.5, mul=1, add=0, in_fader=None):
         pyoArgsAssert(self, "oIOOO", input, outs, pan, mul, add)
         PyoObject.__init__(self, mul, add)
         self._input = input
         self._outs = outs
         self._pan = pan
-        self._in_fader = InputFader(input)
+        self._owns_fader = in_fader is None
+        if in_fader is None:
+            self._in_fader = InputFader(input)
+        else:
+            self._in_fader = in_fader
         in_fader, pan, mul, add, lmax = convertArgsToLists(self._in_fader, pan, mul, add)
-        self._base_players = [SPanner_base(wrap(in_fader,i), outs, wrap(pan,i)) for i in range(lmax)]
-        self._base_objs = []
+        self._ctor_args = (in_fader, pan, mul, add, lmax)
+        self._base_players_real = None
+        self._base_objs_real = None
+
+    def _materialize(self):
+        in_fader, pan, mul, add, lmax = self._ctor_args
+        self._base_players_real = [SPanner_base(wrap(in_fader,i), self._outs, wrap(pan,i)) for i in range(lmax)]
+        self._base_objs_real = []
         for i in range(lmax):
-            for j in range(outs):
-                self._base_objs.append(SPan_base(wrap(self._base_players,i), j, wrap(mul,i), wrap(add,i)))
+            for j in range(self._outs):
+                self._base_objs_real.append(SPan_base(wrap(self._base_players_real,i), j, wrap(mul,i), wrap(add,i)))
+
+    @property
+    def _base_players(self):
+        if self._base_players_real is None:
+            self._materialize()
+        return self._base_players_real
+
+    @property
+    def _base_objs(self):
+        if self._base_objs_real is None:
+            self._materialize()
+        return self._base_objs_real
 
     def setInput(self, x, fadetime=0.05):
         """
@@ -194,6 +265,9 @@ class SPan(PyoObject):
 
         """
         pyoArgsAssert(self, "oN", x, fadetime)
+        if not self._owns_fader:
+            print >> sys.stderr, "%s: setInput is ignored when the InputFader is shared." % self.__class__.__name__
+            return
         self._input = x
         self._in_fader.setInput(x, fadetime)
 
@@ -209,8 +283,11 @@ class SPan(PyoObject):
         """
         pyoArgsAssert(self, "O", x)
         self._pan = x
-        x, lmax = convertArgsToLists(x)
-        [obj.setPan(wrap(x,i)) for i, obj in enumerate(self._base_players)]
+        if type(x) in [IntType, LongType, FloatType]:
+            map(methodcaller("setPan", x), self._base_players)
+        else:
+            x, lmax = convertArgsToLists(x)
+            batch_call(self._base_players, "setPan", x)
 
     def ctrl(self, map_list=None, title=None, wxnoserver=False):
         self._map_list = [SLMapPan(self._pan), SLMapMul(self._mul)]
@@ -252,6 +329,10 @@ class Switch(PyoObject):
         voice : float or PyoObject
             Voice position pointer, between 0 and (outs-1) / len(input).
             Defaults to 0.
+        in_fader : InputFader, optional
+            Already created InputFader to share with other panner objects
+            reading the same source. If None, a private one is created.
+            Defaults to None.
 
     >>> s = Server(nchnls=2).boot()
     >>> s.start()
@@ -263,19 +344,44 @@ class Switch(PyoObject):
     >>> e = Delay(b[4:6], delay=.2, feedback=.6).out()
 
     """
-    def __init__(self, input, outs=2, voice=0., mul=1, add=0):
+    __slots__ = ('_input', '_outs', '_voice', '_in_fader', '_owns_fader',
+                 '_ctor_args', '_base_players_real', '_base_objs_real')
+
+    def __init__(self, input, outs=2, voice=0., mul=1, add=0, in_fader=None):
         pyoArgsAssert(self, "oIOOO", input, outs, voice, mul, add)
         PyoObject.__init__(self, mul, add)
         self._input = input
         self._outs = outs
         self._voice = voice
-        self._in_fader = InputFader(input)
+        self._owns_fader = in_fader is None
+        if in_fader is None:
+            self._in_fader = InputFader(input)
+        else:
+            self._in_fader = in_fader
         in_fader, voice, mul, add, lmax = convertArgsToLists(self._in_fader, voice, mul, add)
-        self._base_players = [Switcher_base(wrap(in_fader,i), outs, wrap(voice,i)) for i in range(lmax)]
-        self._base_objs = []
-        for j in range(outs):
+        self._ctor_args = (in_fader, voice, mul, add, lmax)
+        self._base_players_real = None
+        self._base_objs_real = None
+
+    def _materialize(self):
+        in_fader, voice, mul, add, lmax = self._ctor_args
+        self._base_players_real = [Switcher_base(wrap(in_fader,i), self._outs, wrap(voice,i)) for i in range(lmax)]
+        self._base_objs_real = []
+        for j in range(self._outs):
             for i in range(lmax):
-                self._base_objs.append(Switch_base(wrap(self._base_players,i), j, wrap(mul,i), wrap(add,i)))
+                self._base_objs_real.append(Switch_base(wrap(self._base_players_real,i), j, wrap(mul,i), wrap(add,i)))
+
+    @property
+    def _base_players(self):
+        if self._base_players_real is None:
+            self._materialize()
+        return self._base_players_real
+
+    @property
+    def _base_objs(self):
+        if self._base_objs_real is None:
+            self._materialize()
+        return self._base_objs_real
 
     def setInput(self, x, fadetime=0.05):
         """
@@ -290,6 +396,9 @@ class Switch(PyoObject):
 
         """
         pyoArgsAssert(self, "oN", x, fadetime)
+        if not self._owns_fader:
+            print >> sys.stderr, "%s: setInput is ignored when the InputFader is shared." % self.__class__.__name__
+            return
         self._input = x
         self._in_fader.setInput(x, fadetime)
 
@@ -305,8 +414,11 @@ class Switch(PyoObject):
         """
         pyoArgsAssert(self, "O", x)
         self._voice = x
-        x, lmax = convertArgsToLists(x)
-        [obj.setVoice(wrap(x,i)) for i, obj in enumerate(self._base_players)]
+        if type(x) in [IntType, LongType, FloatType]:
+            map(methodcaller("setVoice", x), self._base_players)
+        else:
+            x, lmax = convertArgsToLists(x)
+            batch_call(self._base_players, "setVoice", x)
 
     def ctrl(self, map_list=None, title=None, wxnoserver=False):
         self._map_list = [SLMap(0, self._outs-1, "lin", "voice", self._voice), SLMapMul(self._mul)]
@@ -352,28 +464,36 @@ class Selector(PyoObject):
     >>> d = Selector(inputs=[a,b,c], voice=lf).out()
 
     """
+    __slots__ = ('_inputs', '_voice', '_input_info', '_lmax', '_length',
+                 '_ctor_args', '_base_objs_real')
+
     def __init__(self, inputs, voice=0., mul=1, add=0):
         pyoArgsAssert(self, "lOOO", inputs, voice, mul, add)
         PyoObject.__init__(self, mul, add)
         self._inputs = inputs
         self._voice = voice
         voice, mul, add, self._lmax = convertArgsToLists(voice, mul, add)
+        self._input_info = [(obj, len(obj)) if hasattr(obj, "__len__") else (obj, None) for obj in self._inputs]
         self._length = 1
-        for obj in self._inputs:
-            try:
-                if len(obj) > self._length: self._length = len(obj)
-            except:
-                pass
-        self._base_objs = []
+        for obj, length in self._input_info:
+            if length > self._length: self._length = length
+        self._ctor_args = (voice, mul, add)
+        self._base_objs_real = None
+
+    def _materialize(self):
+        voice, mul, add = self._ctor_args
+        choices = [[obj[j%length] if length is not None else obj for obj, length in self._input_info]
+                   for j in range(self._length)]
+        self._base_objs_real = []
         for i in range(self._lmax):
             for j in range(self._length):
-                choice = []
-                for obj in self._inputs:
-                    try:
-                        choice.append(obj[j%len(obj)])
-                    except:
-                        choice.append(obj)
-                self._base_objs.append(Selector_base(choice, wrap(voice,i), wrap(mul,i), wrap(add,i)))
+                self._base_objs_real.append(Selector_base(choices[j], wrap(voice,i), wrap(mul,i), wrap(add,i)))
+
+    @property
+    def _base_objs(self):
+        if self._base_objs_real is None:
+            self._materialize()
+        return self._base_objs_real
 
     def setInputs(self, x):
         """
@@ -387,15 +507,12 @@ class Selector(PyoObject):
         """
         pyoArgsAssert(self, "l", x)
         self._inputs = x
+        self._input_info = [(obj, len(obj)) if hasattr(obj, "__len__") else (obj, None) for obj in self._inputs]
+        choices = [[obj[j%length] if length is not None else obj for obj, length in self._input_info]
+                   for j in range(self._length)]
         for i in range(self._lmax):
             for j in range(self._length):
-                choice = []
-                for obj in self._inputs:
-                    try:
-                        choice.append(obj[j%len(obj)])
-                    except:
-                        choice.append(obj)
-                self._base_objs[i+j*self._lmax].setInputs(choice)
+                self._base_objs[i+j*self._lmax].setInputs(choices[j])
 
     def setVoice(self, x):
         """
@@ -409,9 +526,12 @@ class Selector(PyoObject):
         """
         pyoArgsAssert(self, "O", x)
         self._voice = x
-        x, lmax = convertArgsToLists(x)
-        for i, obj in enumerate(self._base_objs):
-            obj.setVoice(wrap(x, i/self._length))
+        if type(x) in [IntType, LongType, FloatType]:
+            map(methodcaller("setVoice", x), self._base_objs)
+        else:
+            x, lmax = convertArgsToLists(x)
+            for i, obj in enumerate(self._base_objs):
+                obj.setVoice(wrap(x, i/self._length))
 
     def ctrl(self, map_list=None, title=None, wxnoserver=False):
         self._map_list = [SLMap(0, len(self._inputs)-1, "lin", "voice", self._voice), SLMapMul(self._mul)]
@@ -531,7 +651,8 @@ class VoiceManager(PyoObject):
                 t_streams = x.getBaseObjects()
             else:
                 t_streams = None
-        [obj.setTriggers(t_streams) for i, obj in enumerate(self._base_objs)]
+        for obj in self._base_objs:
+            obj.setTriggers(t_streams)
 
     @property
     def input(self):
@@ -624,7 +745,8 @@ class Mixer(PyoObject):
         pyoArgsAssert(self, "n", x)
         self._time = x
         x, lmax = convertArgsToLists(x)
-        [obj.setTime(wrap(x,i)) for i, obj in enumerate(self._base_players)]
+        for i, obj in enumerate(self._base_players):
+            obj.setTime(wrap(x,i))
 
     def addInput(self, voice, input):
         """
@@ -651,7 +773,8 @@ class Mixer(PyoObject):
             return
         self._inputs[voice] = input
         input, lmax = convertArgsToLists(input)
-        [obj.addInput(str(voice), wrap(input,i)) for i, obj in enumerate(self._base_players)]
+        for i, obj in enumerate(self._base_players):
+            obj.addInput(str(voice), wrap(input,i))
         return voice
 
     def delInput(self, voice):
@@ -666,7 +789,8 @@ class Mixer(PyoObject):
         """
         if self._inputs.has_key(voice):
             del self._inputs[voice]
-            [obj.delInput(str(voice)) for i, obj in enumerate(self._base_players)]
+            for obj in self._base_players:
+                obj.delInput(str(voice))
 
     def setAmp(self, vin, vout, amp):
         """
@@ -683,7 +807,8 @@ class Mixer(PyoObject):
 
         """
         if self._inputs.has_key(vin) and vout < self._outs:
-            [obj.setAmp(str(vin), vout, amp) for i, obj in enumerate(self._base_players)]
+            for obj in self._base_players:
+                obj.setAmp(str(vin), vout, amp)
 
     def getChannels(self):
         """
@@ -23,6 +23,7 @@ GNU Lesser General Public License for more details.
 You should have received a copy of the GNU Lesser General Public
 License along with pyo.  If not, see <http://www.gnu.org/licenses/>.
 """
+from operator import methodcaller
 from _core import *
 from _maps import *
 
@@ -48,6 +49,10 @@ class Pattern(PyoObject):
 
         Pattern has no `mul` and `add` attributes.
 
+        The function is called from a background thread, not from the
+        audio processing thread, so a long-running function won't cause
+        clicks in the audio output.
+
     >>> s = Server().boot()
     >>> s.start()
     >>> t = HarmTable([1,0,.33,0,.2,0,.143,0,.111])
@@ -59,6 +64,8 @@ class Pattern(PyoObject):
     >>> p.play()
 
     """
+    __slots__ = ('_function', '_time', '_base_objs')
+
     def __init__(self, function, time=1):
         pyoArgsAssert(self, "cO", function, time)
         PyoObject.__init__(self)
@@ -80,7 +87,8 @@ class Pattern(PyoObject):
         pyoArgsAssert(self, "c", x)
         self._function = getWeakMethodRef(x)
         x, lmax = convertArgsToLists(x)
-        [obj.setFunction(WeakMethod(wrap(x,i))) for i, obj in enumerate(self._base_objs)]
+        for i, obj in enumerate(self._base_objs):
+            obj.setFunction(WeakMethod(wrap(x,i)))
 
     def setTime(self, x):
         """
@@ -94,8 +102,12 @@ class Pattern(PyoObject):
         """
         pyoArgsAssert(self, "O", x)
         self._time = x
-        x, lmax = convertArgsToLists(x)
-        [obj.setTime(wrap(x,i)) for i, obj in enumerate(self._base_objs)]
+        if type(x) in [IntType, LongType, FloatType]:
+            map(methodcaller("setTime", x), self._base_objs)
+        else:
+            x, lmax = convertArgsToLists(x)
+            for i, obj in enumerate(self._base_objs):
+                obj.setTime(wrap(x,i))
 
     def out(self, x=0, inc=1, dur=0, delay=0):
         return self.play(dur, delay)
@@ -26,6 +26,7 @@ GNU Lesser General Public License for more details.
 You should have received a copy of the GNU Lesser General Public
 License along with pyo.  If not, see <http://www.gnu.org/licenses/>.
 """
+from operator import methodcaller
 from _core import *
 from _maps import *
 from _widgets import createSpectrumWindow
@@ -120,8 +121,11 @@ class PVAnal(PyoPVObject):
         """
         pyoArgsAssert(self, "i", x)
         self._size = x
-        x, lmax = convertArgsToLists(x)
-        [obj.setSize(wrap(x,i)) for i, obj in enumerate(self._base_objs)]
+        if type(x) in [IntType, LongType, FloatType]:
+            map(methodcaller("setSize", x), self._base_objs)
+        else:
+            x, lmax = convertArgsToLists(x)
+            batch_call(self._base_objs, "setSize", x)
 
     def setOverlaps(self, x):
         """
@@ -135,8 +139,11 @@ class PVAnal(PyoPVObject):
         """
         pyoArgsAssert(self, "i", x)
         self._overlaps = x
-        x, lmax = convertArgsToLists(x)
-        [obj.setOverlaps(wrap(x,i)) for i, obj in enumerate(self._base_objs)]
+        if type(x) in [IntType, LongType, FloatType]:
+            map(methodcaller("setOverlaps", x), self._base_objs)
+        else:
+            x, lmax = convertArgsToLists(x)
+            batch_call(self._base_objs, "setOverlaps", x)
 
     def setWinType(self, x):
         """
@@ -149,8 +156,11 @@ class PVAnal(PyoPVObject):
 
         """
         self._wintype = x
-        x, lmax = convertArgsToLists(x)
-        [obj.setWinType(wrap(x,i)) for i, obj in enumerate(self._base_objs)]
+        if type(x) in [IntType, LongType, FloatType]:
+            map(methodcaller("setWinType", x), self._base_objs)
+        else:
+            x, lmax = convertArgsToLists(x)
+            batch_call(self._base_objs, "setWinType", x)
 
     @property
     def input(self):
@@ -250,8 +260,11 @@ class PVSynth(PyoObject):
         """
         pyoArgsAssert(self, "i", x)
         self._wintype = x
-        x, lmax = convertArgsToLists(x)
-        [obj.setWinType(wrap(x,i)) for i, obj in enumerate(self._base_objs)]
+        if type(x) in [IntType, LongType, FloatType]:
+            map(methodcaller("setWinType", x), self._base_objs)
+        else:
+            x, lmax = convertArgsToLists(x)
+            batch_call(self._base_objs, "setWinType", x)
 
     def ctrl(self, map_list=None, title=None, wxnoserver=False):
         self._map_list = [SLMapMul(self._mul)]
@@ -344,8 +357,11 @@ class PVAddSynth(PyoObject):
         """
         pyoArgsAssert(self, "O", x)
         self._pitch = x
-        x, lmax = convertArgsToLists(x)
-        [obj.setPitch(wrap(x,i)) for i, obj in enumerate(self._base_objs)]
+        if type(x) in [IntType, LongType, FloatType]:
+            map(methodcaller("setPitch", x), self._base_objs)
+        else:
+            x, lmax = convertArgsToLists(x)
+            batch_call(self._base_objs, "setPitch", x)
 
     def setNum(self, x):
         """
@@ -359,8 +375,11 @@ class PVAddSynth(PyoObject):
         """
         pyoArgsAssert(self, "i", x)
         self._num = x
-        x, lmax = convertArgsToLists(x)
-        [obj.setNum(wrap(x,i)) for i, obj in enumerate(self._base_objs)]
+        if type(x) in [IntType, LongType, FloatType]:
+            map(methodcaller("setNum", x), self._base_objs)
+        else:
+            x, lmax = convertArgsToLists(x)
+            batch_call(self._base_objs, "setNum", x)
 
     def setFirst(self, x):
         """
@@ -374,8 +393,11 @@ class PVAddSynth(PyoObject):
         """
         pyoArgsAssert(self, "i", x)
         self._first = x
-        x, lmax = convertArgsToLists(x)
-        [obj.setFirst(wrap(x,i)) for i, obj in enumerate(self._base_objs)]
+        if type(x) in [IntType, LongType, FloatType]:
+            map(methodcaller("setFirst", x), self._base_objs)
+        else:
+            x, lmax = convertArgsToLists(x)
+            batch_call(self._base_objs, "setFirst", x)
 
     def setInc(self, x):
         """
@@ -389,8 +411,11 @@ class PVAddSynth(PyoObject):
         """
         pyoArgsAssert(self, "i", x)
         self._inc = x
-        x, lmax = convertArgsToLists(x)
-        [obj.setInc(wrap(x,i)) for i, obj in enumerate(self._base_objs)]
+        if type(x) in [IntType, LongType, FloatType]:
+            map(methodcaller("setInc", x), self._base_objs)
+        else:
+            x, lmax = convertArgsToLists(x)
+            batch_call(self._base_objs, "setInc", x)
 
     def ctrl(self, map_list=None, title=None, wxnoserver=False):
         self._map_list = [SLMap(0.25, 4, "lin", "pitch", self._pitch),
@@ -489,8 +514,11 @@ class PVTranspose(PyoPVObject):
         """
         pyoArgsAssert(self, "O", x)
         self._transpo = x
-        x, lmax = convertArgsToLists(x)
-        [obj.setTranspo(wrap(x,i)) for i, obj in enumerate(self._base_objs)]
+        if type(x) in [IntType, LongType, FloatType]:
+            map(methodcaller("setTranspo", x), self._base_objs)
+        else:
+            x, lmax = convertArgsToLists(x)
+            batch_call(self._base_objs, "setTranspo", x)
 
     def ctrl(self, map_list=None, title=None, wxnoserver=False):
         self._map_list = [SLMap(0.25, 4, "lin", "transpo", self._transpo)]
@@ -574,8 +602,11 @@ class PVVerb(PyoPVObject):
         """
         pyoArgsAssert(self, "O", x)
         self._revtime = x
-        x, lmax = convertArgsToLists(x)
-        [obj.setRevtime(wrap(x,i)) for i, obj in enumerate(self._base_objs)]
+        if type(x) in [IntType, LongType, FloatType]:
+            map(methodcaller("setRevtime", x), self._base_objs)
+        else:
+            x, lmax = convertArgsToLists(x)
+            batch_call(self._base_objs, "setRevtime", x)
 
     def setDamp(self, x):
         """
@@ -589,8 +620,11 @@ class PVVerb(PyoPVObject):
         """
         pyoArgsAssert(self, "O", x)
         self._damp = x
-        x, lmax = convertArgsToLists(x)
-        [obj.setDamp(wrap(x,i)) for i, obj in enumerate(self._base_objs)]
+        if type(x) in [IntType, LongType, FloatType]:
+            map(methodcaller("setDamp", x), self._base_objs)
+        else:
+            x, lmax = convertArgsToLists(x)
+            batch_call(self._base_objs, "setDamp", x)
 
     def ctrl(self, map_list=None, title=None, wxnoserver=False):
         self._map_list = [SLMap(0, 1, "lin", "revtime", self._revtime),
@@ -678,8 +712,11 @@ class PVGate(PyoPVObject):
         """
         pyoArgsAssert(self, "O", x)
         self._thresh = x
-        x, lmax = convertArgsToLists(x)
-        [obj.setThresh(wrap(x,i)) for i, obj in enumerate(self._base_objs)]
+        if type(x) in [IntType, LongType, FloatType]:
+            map(methodcaller("setThresh", x), self._base_objs)
+        else:
+            x, lmax = convertArgsToLists(x)
+            batch_call(self._base_objs, "setThresh", x)
 
     def setDamp(self, x):
         """
@@ -693,8 +730,11 @@ class PVGate(PyoPVObject):
         """
         pyoArgsAssert(self, "O", x)
         self._damp = x
-        x, lmax = convertArgsToLists(x)
-        [obj.setDamp(wrap(x,i)) for i, obj in enumerate(self._base_objs)]
+        if type(x) in [IntType, LongType, FloatType]:
+            map(methodcaller("setDamp", x), self._base_objs)
+        else:
+            x, lmax = convertArgsToLists(x)
+            batch_call(self._base_objs, "setDamp", x)
 
     def ctrl(self, map_list=None, title=None, wxnoserver=False):
         self._map_list = [SLMap(-120, 18, "lin", "thresh", self._thresh),
@@ -722,6 +762,98 @@ class PVGate(PyoPVObject):
     @damp.setter
     def damp(self, x): self.setDamp(x)
 
+class PVChain(PyoPVObject):
+    """
+    Applies a chain of spectral effects in a single pass.
+
+    PVChain processes a sequence of spectral operations (transposition,
+    gating, reverberation) on its input with a single walk over each
+    analysis frame. It produces the same frames as a chain of the
+    corresponding PV objects (PVTranspose, PVGate, PVVerb) but skips
+    the intermediate magnitude/frequency buffers between stages, which
+    saves memory bandwidth with large FFT sizes or long chains.
+
+    :Parent: :py:class:`PyoPVObject`
+
+    :Args:
+
+        input : PyoPVObject
+            Phase vocoder streaming object to process.
+        ops : list of tuples
+            Spectral operations, applied in order. Each tuple begins
+            with the operation name, followed by its parameters:
+
+            - ("transpose", transpo): transposition factor.
+            - ("gate", thresh, damp): threshold, in dB, and gain applied
+              to the bins under the threshold.
+            - ("verb", revtime, damp): reverberation factor and high
+              frequency damping, both between 0 and 1.
+
+    .. note::
+
+        Operation parameters are plain numbers, read when the list is
+        set. Use the individual PV objects if an effect parameter must
+        be controlled by an audio signal.
+
+    >>> s = Server().boot()
+    >>> s.start()
+    >>> sf = SfPlayer(SNDS_PATH+"/transparent.aif", loop=True, mul=.5)
+    >>> pva = PVAnal(sf, size=1024)
+    >>> pvc = PVChain(pva, [("transpose", 1.25), ("gate", -40, .25), ("verb", .8, .8)])
+    >>> pvs = PVSynth(pvc).out()
+
+    """
+    def __init__(self, input, ops):
+        pyoArgsAssert(self, "pl", input, ops)
+        PyoPVObject.__init__(self)
+        self._input = input
+        self._ops = ops
+        input, lmax = convertArgsToLists(self._input)
+        self._base_objs = [PVChain_base(wrap(input,i), ops) for i in range(lmax)]
+
+    def setInput(self, x):
+        """
+        Replace the `input` attribute.
+
+        :Args:
+
+            x : PyoPVObject
+                New signal to process.
+
+        """
+        pyoArgsAssert(self, "p", x)
+        self._input = x
+        x, lmax = convertArgsToLists(x)
+        [obj.setInput(wrap(x,i)) for i, obj in enumerate(self._base_objs)]
+
+    def setOps(self, x):
+        """
+        Replace the `ops` attribute.
+
+        :Args:
+
+            x : list of tuples
+                new `ops` attribute.
+
+        """
+        pyoArgsAssert(self, "l", x)
+        self._ops = x
+        [obj.setOps(x) for obj in self._base_objs]
+
+    @property
+    def input(self):
+        """PyoPVObject. Input signal to process."""
+        return self._input
+    @input.setter
+    def input(self, x): self.setInput(x)
+
+    @property
+    def ops(self):
+        """list of tuples. Spectral operations, applied in order."""
+        return self._ops
+    @ops.setter
+    def ops(self, x): self.setOps(x)
+
 class PVCross(PyoPVObject):
     """
     Performs cross-synthesis between two phase vocoder streaming object.
@@ -820,8 +952,11 @@ class PVCross(PyoPVObject):
         """
         pyoArgsAssert(self, "O", x)
         self._fade = x
-        x, lmax = convertArgsToLists(x)
-        [obj.setFade(wrap(x,i)) for i, obj in enumerate(self._base_objs)]
+        if type(x) in [IntType, LongType, FloatType]:
+            map(methodcaller("setFade", x), self._base_objs)
+        else:
+            x, lmax = convertArgsToLists(x)
+            batch_call(self._base_objs, "setFade", x)
 
     def ctrl(self, map_list=None, title=None, wxnoserver=False):
         self._map_list = [SLMap(0, 1, "lin", "fade", self._fade)]
@@ -1038,8 +1173,11 @@ class PVMorph(PyoPVObject):
         """
         pyoArgsAssert(self, "O", x)
         self._fade = x
-        x, lmax = convertArgsToLists(x)
-        [obj.setFade(wrap(x,i)) for i, obj in enumerate(self._base_objs)]
+        if type(x) in [IntType, LongType, FloatType]:
+            map(methodcaller("setFade", x), self._base_objs)
+        else:
+            x, lmax = convertArgsToLists(x)
+            batch_call(self._base_objs, "setFade", x)
 
     def ctrl(self, map_list=None, title=None, wxnoserver=False):
         self._map_list = [SLMap(0, 1, "lin", "fade", self._fade)]
@@ -1139,8 +1277,11 @@ class PVFilter(PyoPVObject):
         """
         pyoArgsAssert(self, "t", x)
         self._table = x
-        x, lmax = convertArgsToLists(x)
-        [obj.setTable(wrap(x,i)) for i, obj in enumerate(self._base_objs)]
+        if type(x) in [IntType, LongType, FloatType]:
+            map(methodcaller("setTable", x), self._base_objs)
+        else:
+            x, lmax = convertArgsToLists(x)
+            batch_call(self._base_objs, "setTable", x)
 
     def setGain(self, x):
         """
@@ -1154,8 +1295,11 @@ class PVFilter(PyoPVObject):
         """
         pyoArgsAssert(self, "O", x)
         self._gain = x
-        x, lmax = convertArgsToLists(x)
-        [obj.setGain(wrap(x,i)) for i, obj in enumerate(self._base_objs)]
+        if type(x) in [IntType, LongType, FloatType]:
+            map(methodcaller("setGain", x), self._base_objs)
+        else:
+            x, lmax = convertArgsToLists(x)
+            batch_call(self._base_objs, "setGain", x)
 
     def setMode(self, x):
         """
@@ -1169,8 +1313,11 @@ class PVFilter(PyoPVObject):
         """
         pyoArgsAssert(self, "i", x)
         self._mode = x
-        x, lmax = convertArgsToLists(x)
-        [obj.setMode(wrap(x,i)) for i, obj in enumerate(self._base_objs)]
+        if type(x) in [IntType, LongType, FloatType]:
+            map(methodcaller("setMode", x), self._base_objs)
+        else:
+            x, lmax = convertArgsToLists(x)
+            batch_call(self._base_objs, "setMode", x)
 
     def ctrl(self, map_list=None, title=None, wxnoserver=False):
         self._map_list = [SLMap(0, 1, "lin", "gain", self._gain)]
@@ -1292,8 +1439,11 @@ class PVDelay(PyoPVObject):
         """
         pyoArgsAssert(self, "t", x)
         self._deltable = x
-        x, lmax = convertArgsToLists(x)
-        [obj.setDeltable(wrap(x,i)) for i, obj in enumerate(self._base_objs)]
+        if type(x) in [IntType, LongType, FloatType]:
+            map(methodcaller("setDeltable", x), self._base_objs)
+        else:
+            x, lmax = convertArgsToLists(x)
+            batch_call(self._base_objs, "setDeltable", x)
 
     def setFeedtable(self, x):
         """
@@ -1307,8 +1457,11 @@ class PVDelay(PyoPVObject):
         """
         pyoArgsAssert(self, "t", x)
         self._feedtable = x
-        x, lmax = convertArgsToLists(x)
-        [obj.setFeedtable(wrap(x,i)) for i, obj in enumerate(self._base_objs)]
+        if type(x) in [IntType, LongType, FloatType]:
+            map(methodcaller("setFeedtable", x), self._base_objs)
+        else:
+            x, lmax = convertArgsToLists(x)
+            batch_call(self._base_objs, "setFeedtable", x)
 
     def setMode(self, x):
         """
@@ -1322,8 +1475,11 @@ class PVDelay(PyoPVObject):
         """
         pyoArgsAssert(self, "i", x)
         self._mode = x
-        x, lmax = convertArgsToLists(x)
-        [obj.setMode(wrap(x,i)) for i, obj in enumerate(self._base_objs)]
+        if type(x) in [IntType, LongType, FloatType]:
+            map(methodcaller("setMode", x), self._base_objs)
+        else:
+            x, lmax = convertArgsToLists(x)
+            batch_call(self._base_objs, "setMode", x)
 
     @property
     def input(self):
@@ -1428,8 +1584,11 @@ class PVBuffer(PyoPVObject):
         """
         pyoArgsAssert(self, "o", x)
         self._index = x
-        x, lmax = convertArgsToLists(x)
-        [obj.setIndex(wrap(x,i)) for i, obj in enumerate(self._base_objs)]
+        if type(x) in [IntType, LongType, FloatType]:
+            map(methodcaller("setIndex", x), self._base_objs)
+        else:
+            x, lmax = convertArgsToLists(x)
+            batch_call(self._base_objs, "setIndex", x)
 
     def setPitch(self, x):
         """
@@ -1443,8 +1602,11 @@ class PVBuffer(PyoPVObject):
         """
         pyoArgsAssert(self, "O", x)
         self._pitch = x
-        x, lmax = convertArgsToLists(x)
-        [obj.setPitch(wrap(x,i)) for i, obj in enumerate(self._base_objs)]
+        if type(x) in [IntType, LongType, FloatType]:
+            map(methodcaller("setPitch", x), self._base_objs)
+        else:
+            x, lmax = convertArgsToLists(x)
+            batch_call(self._base_objs, "setPitch", x)
 
     def ctrl(self, map_list=None, title=None, wxnoserver=False):
         self._map_list = [SLMap(0.25, 4, "lin", "pitch", self._pitch)]
@@ -1530,8 +1692,11 @@ class PVShift(PyoPVObject):
         """
         pyoArgsAssert(self, "O", x)
         self._shift = x
-        x, lmax = convertArgsToLists(x)
-        [obj.setShift(wrap(x,i)) for i, obj in enumerate(self._base_objs)]
+        if type(x) in [IntType, LongType, FloatType]:
+            map(methodcaller("setShift", x), self._base_objs)
+        else:
+            x, lmax = convertArgsToLists(x)
+            batch_call(self._base_objs, "setShift", x)
 
     def ctrl(self, map_list=None, title=None, wxnoserver=False):
         self._map_list = [SLMap(-5000, 5000, "lin", "shift", self._shift)]
@@ -1624,8 +1789,11 @@ class PVAmpMod(PyoPVObject):
         """
         pyoArgsAssert(self, "O", x)
         self._basefreq = x
-        x, lmax = convertArgsToLists(x)
-        [obj.setBasefreq(wrap(x,i)) for i, obj in enumerate(self._base_objs)]
+        if type(x) in [IntType, LongType, FloatType]:
+            map(methodcaller("setBasefreq", x), self._base_objs)
+        else:
+            x, lmax = convertArgsToLists(x)
+            batch_call(self._base_objs, "setBasefreq", x)
 
     def setSpread(self, x):
         """
@@ -1639,8 +1807,11 @@ class PVAmpMod(PyoPVObject):
         """
         pyoArgsAssert(self, "O", x)
         self._spread = x
-        x, lmax = convertArgsToLists(x)
-        [obj.setSpread(wrap(x,i)) for i, obj in enumerate(self._base_objs)]
+        if type(x) in [IntType, LongType, FloatType]:
+            map(methodcaller("setSpread", x), self._base_objs)
+        else:
+            x, lmax = convertArgsToLists(x)
+            batch_call(self._base_objs, "setSpread", x)
 
     def reset(self):
         """
@@ -1752,8 +1923,11 @@ class PVFreqMod(PyoPVObject):
         """
         pyoArgsAssert(self, "O", x)
         self._basefreq = x
-        x, lmax = convertArgsToLists(x)
-        [obj.setBasefreq(wrap(x,i)) for i, obj in enumerate(self._base_objs)]
+        if type(x) in [IntType, LongType, FloatType]:
+            map(methodcaller("setBasefreq", x), self._base_objs)
+        else:
+            x, lmax = convertArgsToLists(x)
+            batch_call(self._base_objs, "setBasefreq", x)
 
     def setSpread(self, x):
         """
@@ -1767,8 +1941,11 @@ class PVFreqMod(PyoPVObject):
         """
         pyoArgsAssert(self, "O", x)
         self._spread = x
-        x, lmax = convertArgsToLists(x)
-        [obj.setSpread(wrap(x,i)) for i, obj in enumerate(self._base_objs)]
+        if type(x) in [IntType, LongType, FloatType]:
+            map(methodcaller("setSpread", x), self._base_objs)
+        else:
+            x, lmax = convertArgsToLists(x)
+            batch_call(self._base_objs, "setSpread", x)
 
     def setDepth(self, x):
         """
@@ -1782,8 +1959,11 @@ class PVFreqMod(PyoPVObject):
         """
         pyoArgsAssert(self, "O", x)
         self._depth = x
-        x, lmax = convertArgsToLists(x)
-        [obj.setDepth(wrap(x,i)) for i, obj in enumerate(self._base_objs)]
+        if type(x) in [IntType, LongType, FloatType]:
+            map(methodcaller("setDepth", x), self._base_objs)
+        else:
+            x, lmax = convertArgsToLists(x)
+            batch_call(self._base_objs, "setDepth", x)
 
     def reset(self):
         """
@@ -1911,8 +2091,11 @@ class PVBufLoops(PyoPVObject):
         """
         pyoArgsAssert(self, "O", x)
         self._low = x
-        x, lmax = convertArgsToLists(x)
-        [obj.setLow(wrap(x,i)) for i, obj in enumerate(self._base_objs)]
+        if type(x) in [IntType, LongType, FloatType]:
+            map(methodcaller("setLow", x), self._base_objs)
+        else:
+            x, lmax = convertArgsToLists(x)
+            batch_call(self._base_objs, "setLow", x)
 
     def setHigh(self, x):
         """
@@ -1926,8 +2109,11 @@ class PVBufLoops(PyoPVObject):
         """
         pyoArgsAssert(self, "O", x)
         self._high = x
-        x, lmax = convertArgsToLists(x)
-        [obj.setHigh(wrap(x,i)) for i, obj in enumerate(self._base_objs)]
+        if type(x) in [IntType, LongType, FloatType]:
+            map(methodcaller("setHigh", x), self._base_objs)
+        else:
+            x, lmax = convertArgsToLists(x)
+            batch_call(self._base_objs, "setHigh", x)
 
     def setMode(self, x):
         """
@@ -1941,8 +2127,11 @@ class PVBufLoops(PyoPVObject):
         """
         pyoArgsAssert(self, "i", x)
         self._mode = x
-        x, lmax = convertArgsToLists(x)
-        [obj.setMode(wrap(x,i)) for i, obj in enumerate(self._base_objs)]
+        if type(x) in [IntType, LongType, FloatType]:
+            map(methodcaller("setMode", x), self._base_objs)
+        else:
+            x, lmax = convertArgsToLists(x)
+            batch_call(self._base_objs, "setMode", x)
 
     def reset(self):
         """
@@ -2056,8 +2245,11 @@ class PVBufTabLoops(PyoPVObject):
         """
         pyoArgsAssert(self, "t", x)
         self._speed = x
-        x, lmax = convertArgsToLists(x)
-        [obj.setSpeed(wrap(x,i)) for i, obj in enumerate(self._base_objs)]
+        if type(x) in [IntType, LongType, FloatType]:
+            map(methodcaller("setSpeed", x), self._base_objs)
+        else:
+            x, lmax = convertArgsToLists(x)
+            batch_call(self._base_objs, "setSpeed", x)
 
     def reset(self):
         """
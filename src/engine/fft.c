@@ -59,6 +59,38 @@ void fft_compute_split_twiddle(MYFLT **twiddle, int size) {
     return;
 }
 
+/* Shared split-radix twiddle tables, keyed by FFT size. Sizes are
+   powers of two so only a handful of entries ever exist; tables live
+   for the lifetime of the process and are shared by every reader, so
+   callers must not free them. */
+#define FFT_TWIDDLE_CACHE_SIZE 32
+static struct {
+    int size;
+    MYFLT *twiddle[4];
+} FFT_TWIDDLE_CACHE[FFT_TWIDDLE_CACHE_SIZE];
+
+MYFLT ** fft_get_shared_twiddle(int size) {
+    int i, j;
+    int n8 = size >> 3;
+    MYFLT **twiddle;
+    for (i=0; i<FFT_TWIDDLE_CACHE_SIZE; i++) {
+        if (FFT_TWIDDLE_CACHE[i].size == size)
+            return FFT_TWIDDLE_CACHE[i].twiddle;
+        if (FFT_TWIDDLE_CACHE[i].size == 0)
+            break;
+    }
+    if (i < FFT_TWIDDLE_CACHE_SIZE)
+        twiddle = FFT_TWIDDLE_CACHE[i].twiddle;
+    else /* cache full, hand out a private (leaked) table */
+        twiddle = (MYFLT **)malloc(4 * sizeof(MYFLT *));
+    for (j=0; j<4; j++)
+        twiddle[j] = (MYFLT *)malloc(n8 * sizeof(MYFLT));
+    fft_compute_split_twiddle(twiddle, size);
+    if (i < FFT_TWIDDLE_CACHE_SIZE)
+        FFT_TWIDDLE_CACHE[i].size = size;
+    return twiddle;
+}
+
 void fft_compute_radix2_twiddle(MYFLT *twiddle, int size) {
     /* pre-compute radix-2 twiddle factors in one array of length n */
     /* re[0], re[1], ..., re[n/2-1], im[0], im[1], ..., im[n/2-1] */
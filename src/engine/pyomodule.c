@@ -2191,6 +2191,151 @@ serverBooted(PyObject *self) {
     }
 }
 
+#define batch_play_info \
+"\nCalls the play() method of every object in a list from a single C loop.\n\n\
+For internal use. Amortizes the Python dispatch cost when an object\n\
+manages many base streams. `durs` and `delays` are lists of numbers,\n\
+wrapped around their own length.\n\n"
+
+static PyObject *
+batch_play(PyObject *self, PyObject *args) {
+    int i, n, ndurs, ndelays;
+    PyObject *objs, *durs, *delays, *result;
+
+    if (! PyArg_ParseTuple(args, "OOO", &objs, &durs, &delays))
+        return NULL;
+
+    n = PyList_Size(objs);
+    ndurs = PyList_Size(durs);
+    ndelays = PyList_Size(delays);
+    for (i=0; i<n; i++) {
+        result = PyObject_CallMethod(PyList_GET_ITEM(objs, i), "play", "OO",
+                                     PyList_GET_ITEM(durs, i % ndurs),
+                                     PyList_GET_ITEM(delays, i % ndelays));
+        if (result == NULL)
+            return NULL;
+        Py_DECREF(result);
+    }
+    Py_RETURN_NONE;
+}
+
+#define batch_out_info \
+"\nCalls the out() method of every object in a list from a single C loop.\n\n\
+For internal use. Covers the common case where `chnl` is a non-negative\n\
+integer: stream i goes to output chnl + i * inc. `durs` and `delays` are\n\
+lists of numbers, wrapped around their own length.\n\n"
+
+static PyObject *
+batch_out(PyObject *self, PyObject *args) {
+    int i, n, ndurs, ndelays, chnl, inc;
+    PyObject *objs, *durs, *delays, *result;
+
+    if (! PyArg_ParseTuple(args, "OiiOO", &objs, &chnl, &inc, &durs, &delays))
+        return NULL;
+
+    n = PyList_Size(objs);
+    ndurs = PyList_Size(durs);
+    ndelays = PyList_Size(delays);
+    for (i=0; i<n; i++) {
+        result = PyObject_CallMethod(PyList_GET_ITEM(objs, i), "out", "iOO",
+                                     chnl + i * inc,
+                                     PyList_GET_ITEM(durs, i % ndurs),
+                                     PyList_GET_ITEM(delays, i % ndelays));
+        if (result == NULL)
+            return NULL;
+        Py_DECREF(result);
+    }
+    Py_RETURN_NONE;
+}
+
+#define batch_out_list_info \
+"\nCalls the out() method of every object in a list from a single C loop,\n\
+with an explicit channel target per stream.\n\n\
+For internal use. `chnls`, `durs` and `delays` are lists wrapped around\n\
+their own length.\n\n"
+
+static PyObject *
+batch_out_list(PyObject *self, PyObject *args) {
+    int i, n, nchnls, ndurs, ndelays;
+    PyObject *objs, *chnls, *durs, *delays, *result;
+
+    if (! PyArg_ParseTuple(args, "OOOO", &objs, &chnls, &durs, &delays))
+        return NULL;
+
+    n = PyList_Size(objs);
+    nchnls = PyList_Size(chnls);
+    ndurs = PyList_Size(durs);
+    ndelays = PyList_Size(delays);
+    for (i=0; i<n; i++) {
+        result = PyObject_CallMethod(PyList_GET_ITEM(objs, i), "out", "OOO",
+                                     PyList_GET_ITEM(chnls, i % nchnls),
+                                     PyList_GET_ITEM(durs, i % ndurs),
+                                     PyList_GET_ITEM(delays, i % ndelays));
+        if (result == NULL)
+            return NULL;
+        Py_DECREF(result);
+    }
+    Py_RETURN_NONE;
+}
+
+#define batch_call_info \
+"\nCalls a named one-argument method of every object in a list from a\n\
+single C loop.\n\n\
+For internal use. `values` is a list of arguments, wrapped around its\n\
+own length like wrap() does; multi-stream pyo objects are unwrapped to\n\
+their first base object.\n\n"
+
+static PyObject *
+batch_call(PyObject *self, PyObject *args) {
+    int i, n, nvals;
+    char *method;
+    PyObject *objs, *vals, *val, *result;
+
+    if (! PyArg_ParseTuple(args, "OsO", &objs, &method, &vals))
+        return NULL;
+
+    n = PyList_Size(objs);
+    nvals = PyList_Size(vals);
+    for (i=0; i<n; i++) {
+        val = PyList_GET_ITEM(vals, i % nvals);
+        if (PyObject_HasAttrString(val, "getBaseObjects")) {
+            /* PyoObjectBase: same unwrap as wrap() in _core.py */
+            val = PySequence_GetItem(val, 0);
+            if (val == NULL)
+                return NULL;
+            result = PyObject_CallMethod(PyList_GET_ITEM(objs, i), method, "O", val);
+            Py_DECREF(val);
+        }
+        else {
+            result = PyObject_CallMethod(PyList_GET_ITEM(objs, i), method, "O", val);
+        }
+        if (result == NULL)
+            return NULL;
+        Py_DECREF(result);
+    }
+    Py_RETURN_NONE;
+}
+
+#define batch_stop_info \
+"\nCalls the stop() method of every object in a list from a single C loop.\n\n\
+For internal use. Amortizes the Python dispatch cost when an object\n\
+manages many base streams.\n\n"
+
+static PyObject *
+batch_stop(PyObject *self, PyObject *arg) {
+    int i, n;
+    PyObject *result;
+
+    n = PyList_Size(arg);
+    for (i=0; i<n; i++) {
+        result = PyObject_CallMethod(PyList_GET_ITEM(arg, i), "stop", NULL);
+        if (result == NULL)
+            return NULL;
+        Py_DECREF(result);
+    }
+    Py_RETURN_NONE;
+}
+
 static PyMethodDef pyo_functions[] = {
 {"pa_get_version", (PyCFunction)portaudio_get_version, METH_NOARGS, portaudio_get_version_info},
 {"pa_get_version_text", (PyCFunction)portaudio_get_version_text, METH_NOARGS, portaudio_get_version_text_info},
@@ -2229,6 +2374,11 @@ static PyMethodDef pyo_functions[] = {
 {"secToSamps", (PyCFunction)secToSamps, METH_O, secToSamps_info},
 {"serverCreated", (PyCFunction)serverCreated, METH_NOARGS, serverCreated_info},
 {"serverBooted", (PyCFunction)serverBooted, METH_NOARGS, serverBooted_info},
+{"batch_play", (PyCFunction)batch_play, METH_VARARGS, batch_play_info},
+{"batch_out", (PyCFunction)batch_out, METH_VARARGS, batch_out_info},
+{"batch_out_list", (PyCFunction)batch_out_list, METH_VARARGS, batch_out_list_info},
+{"batch_stop", (PyCFunction)batch_stop, METH_O, batch_stop_info},
+{"batch_call", (PyCFunction)batch_call, METH_VARARGS, batch_call_info},
 {NULL, NULL, 0, NULL},
 };
 
@@ -2516,6 +2666,7 @@ init_pyo64(void)
     module_add_object(m, "PVTranspose_base", &PVTransposeType);
     module_add_object(m, "PVVerb_base", &PVVerbType);
     module_add_object(m, "PVGate_base", &PVGateType);
+    module_add_object(m, "PVChain_base", &PVChainType);
     module_add_object(m, "PVAddSynth_base", &PVAddSynthType);
     module_add_object(m, "PVCross_base", &PVCrossType);
     module_add_object(m, "PVMult_base", &PVMultType);
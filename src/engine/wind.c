@@ -122,3 +122,33 @@ void gen_window(MYFLT *window, int size, int wintype) {
     }
     return;
 }
+
+/* Shared window tables, keyed by (size, wintype). FFT sizes are powers
+   of two and wintype is a small enum, so only a handful of entries
+   ever exist; tables live for the lifetime of the process and are
+   shared by every reader, so callers must not modify or free them. */
+#define GEN_WINDOW_CACHE_SIZE 32
+static struct {
+    int size;
+    int wintype;
+    MYFLT *window;
+} GEN_WINDOW_CACHE[GEN_WINDOW_CACHE_SIZE];
+
+MYFLT * gen_get_shared_window(int size, int wintype) {
+    int i;
+    MYFLT *window;
+    for (i=0; i<GEN_WINDOW_CACHE_SIZE; i++) {
+        if (GEN_WINDOW_CACHE[i].size == size && GEN_WINDOW_CACHE[i].wintype == wintype)
+            return GEN_WINDOW_CACHE[i].window;
+        if (GEN_WINDOW_CACHE[i].size == 0)
+            break;
+    }
+    window = (MYFLT *)malloc(size * sizeof(MYFLT));
+    gen_window(window, size, wintype);
+    if (i < GEN_WINDOW_CACHE_SIZE) {
+        GEN_WINDOW_CACHE[i].size = size;
+        GEN_WINDOW_CACHE[i].wintype = wintype;
+        GEN_WINDOW_CACHE[i].window = window;
+    } /* else: cache full, hand out a private (leaked) table */
+    return window;
+}
@@ -37,6 +37,8 @@ typedef struct {
     int chnls;
     int modebuffer[2];
     MYFLT *buffer_streams;
+    MYFLT *gain_table;
+    MYFLT gain_table_sprd;
 } Panner;
 
 static MYFLT
@@ -49,6 +51,94 @@ P_clip(MYFLT p) {
         return p;
 }
 
+/* Panning law lookup tables, shared by every Panner/SPanner instance.
+   PAN_COS_WINDOW holds one period of the cosine law (cos(x*TWOPI)*0.5+0.5),
+   PAN_SQRT_WINDOW holds the equal power law (sqrt(x)), both over [0, 1].
+   The extra guard point keeps the linear interpolation in bounds. */
+#define PAN_WINDOW_SIZE 4096
+static MYFLT PAN_COS_WINDOW[PAN_WINDOW_SIZE + 2];
+static MYFLT PAN_SQRT_WINDOW[PAN_WINDOW_SIZE + 2];
+static int PAN_WINDOWS_INIT = 0;
+
+static void
+Pan_init_windows() {
+    int i;
+    MYFLT inc;
+    if (PAN_WINDOWS_INIT)
+        return;
+    inc = 1.0 / (MYFLT)PAN_WINDOW_SIZE;
+    for (i=0; i<=PAN_WINDOW_SIZE; i++) {
+        PAN_COS_WINDOW[i] = MYCOS(TWOPI * i * inc) * 0.5 + 0.5;
+        PAN_SQRT_WINDOW[i] = MYSQRT(i * inc);
+    }
+    PAN_COS_WINDOW[PAN_WINDOW_SIZE+1] = PAN_COS_WINDOW[PAN_WINDOW_SIZE];
+    PAN_SQRT_WINDOW[PAN_WINDOW_SIZE+1] = PAN_SQRT_WINDOW[PAN_WINDOW_SIZE];
+    PAN_WINDOWS_INIT = 1;
+}
+
+/* `pos` must be in the range [0, 1]. */
+static MYFLT
+Pan_window_lookup(MYFLT *window, MYFLT pos) {
+    MYFLT fpos = pos * PAN_WINDOW_SIZE;
+    int ipos = (int)fpos;
+    MYFLT frac = fpos - ipos;
+    return window[ipos] + (window[ipos+1] - window[ipos]) * frac;
+}
+
+/* out[i] = in[i] * gain over n samples. The AVX/SSE2 paths process 8/4
+   single precision samples per instruction; double precision builds and
+   compilers without SIMD support fall back to the scalar loop. */
+#if !defined(USE_DOUBLE) && defined(__AVX__)
+#include <immintrin.h>
+static void
+Pan_apply_gain(MYFLT *out, MYFLT *in, MYFLT gain, int n) {
+    int i;
+    __m256 g = _mm256_set1_ps(gain);
+    for (i=0; i<=n-8; i+=8) {
+        _mm256_storeu_ps(out+i, _mm256_mul_ps(_mm256_loadu_ps(in+i), g));
+    }
+    for (; i<n; i++) {
+        out[i] = in[i] * gain;
+    }
+}
+#elif !defined(USE_DOUBLE) && defined(__SSE2__)
+#include <emmintrin.h>
+static void
+Pan_apply_gain(MYFLT *out, MYFLT *in, MYFLT gain, int n) {
+    int i;
+    __m128 g = _mm_set1_ps(gain);
+    for (i=0; i<=n-4; i+=4) {
+        _mm_storeu_ps(out+i, _mm_mul_ps(_mm_loadu_ps(in+i), g));
+    }
+    for (; i<n; i++) {
+        out[i] = in[i] * gain;
+    }
+}
+#else
+static void
+Pan_apply_gain(MYFLT *out, MYFLT *in, MYFLT gain, int n) {
+    int i;
+    for (i=0; i<n; i++) {
+        out[i] = in[i] * gain;
+    }
+}
+#endif
+
+/* With a scalar spread, the channel gain depends only on the phase, so
+   the cosine law raised to the spread exponent can be tabulated once,
+   removing the pow() call from the per-sample kernels. The table is
+   rebuilt only when the spread value changes. */
+static void
+Panner_update_gain_table(Panner *self, MYFLT sprd) {
+    int i;
+    if (self->gain_table_sprd == sprd)
+        return;
+    for (i=0; i<PAN_WINDOW_SIZE+2; i++) {
+        self->gain_table[i] = MYPOW(PAN_COS_WINDOW[i], sprd);
+    }
+    self->gain_table_sprd = sprd;
+}
+
 static void
 Panner_splitter_thru(Panner *self) {
     int i;
@@ -61,20 +151,13 @@ Panner_splitter_thru(Panner *self) {
 
 static void
 Panner_splitter_st_i(Panner *self) {
-    MYFLT val, inval;
-    int i;
     MYFLT *in = Stream_getData((Stream *)self->input_stream);
 
     MYFLT pan = PyFloat_AS_DOUBLE(self->pan);
     pan = P_clip(pan);
 
-    for (i=0; i<self->bufsize; i++) {
-        inval = in[i];
-        val = inval * MYSQRT(1.0 - pan);
-        self->buffer_streams[i] = val;
-        val = inval * MYSQRT(pan);
-        self->buffer_streams[i+self->bufsize] = val;
-    }
+    Pan_apply_gain(self->buffer_streams, in, MYSQRT(1.0 - pan), self->bufsize);
+    Pan_apply_gain(self->buffer_streams + self->bufsize, in, MYSQRT(pan), self->bufsize);
 }
 
 static void
@@ -88,17 +171,17 @@ Panner_splitter_st_a(Panner *self) {
     for (i=0; i<self->bufsize; i++) {
         inval = in[i];
         panval = P_clip(pan[i]);
-        val = inval * MYSQRT(1.0 - panval);
+        val = inval * Pan_window_lookup(PAN_SQRT_WINDOW, 1.0 - panval);
         self->buffer_streams[i] = val;
-        val = inval * MYSQRT(panval);
+        val = inval * Pan_window_lookup(PAN_SQRT_WINDOW, panval);
         self->buffer_streams[i+self->bufsize] = val;
     }
 }
 
 static void
 Panner_splitter_ii(Panner *self) {
-    MYFLT val, inval, phase, sprd;
-    int j, i;
+    MYFLT val, phase, sprd;
+    int j;
     MYFLT *in = Stream_getData((Stream *)self->input_stream);
 
     MYFLT pan = PyFloat_AS_DOUBLE(self->pan);
@@ -108,20 +191,20 @@ Panner_splitter_ii(Panner *self) {
     spd = P_clip(spd);
 
     sprd = 20.0 - (MYSQRT(spd) * 20.0) + 0.1;
+    Panner_update_gain_table(self, sprd);
 
-    for (i=0; i<self->bufsize; i++) {
-        inval = in[i];
-        for (j=0; j<self->chnls; j++) {
-            phase = j / (MYFLT)self->chnls;
-            val = inval * MYPOW(MYCOS((pan - phase) * TWOPI) * 0.5 + 0.5, sprd);
-            self->buffer_streams[i+j*self->bufsize] = val;
-        }
+    for (j=0; j<self->chnls; j++) {
+        phase = pan - j / (MYFLT)self->chnls;
+        if (phase < 0.0)
+            phase += 1.0;
+        val = Pan_window_lookup(self->gain_table, phase);
+        Pan_apply_gain(self->buffer_streams + j*self->bufsize, in, val, self->bufsize);
     }
 }
 
 static void
 Panner_splitter_ai(Panner *self) {
-    MYFLT val, inval, phase, sprd;
+    MYFLT val, inval, phase, sprd, panval;
     int j, i;
     MYFLT *in = Stream_getData((Stream *)self->input_stream);
 
@@ -131,12 +214,16 @@ Panner_splitter_ai(Panner *self) {
     spd = P_clip(spd);
 
     sprd = 20.0 - (MYSQRT(spd) * 20.0) + 0.1;
+    Panner_update_gain_table(self, sprd);
 
     for (i=0; i<self->bufsize; i++) {
         inval = in[i];
+        panval = P_clip(pan[i]);
         for (j=0; j<self->chnls; j++) {
-            phase = j / (MYFLT)self->chnls;
-            val = inval * MYPOW(MYCOS((P_clip(pan[i]) - phase) * TWOPI) * 0.5 + 0.5, sprd);
+            phase = panval - j / (MYFLT)self->chnls;
+            if (phase < 0.0)
+                phase += 1.0;
+            val = inval * Pan_window_lookup(self->gain_table, phase);
             self->buffer_streams[i+j*self->bufsize] = val;
         }
     }
@@ -158,8 +245,10 @@ Panner_splitter_ia(Panner *self) {
         spdval = P_clip(spd[i]);
         sprd = 20.0 - (MYSQRT(spdval) * 20.0) + 0.1;
         for (j=0; j<self->chnls; j++) {
-            phase = j / (MYFLT)self->chnls;
-            val = inval * MYPOW(MYCOS((pan - phase) * TWOPI) * 0.5 + 0.5, sprd);
+            phase = pan - j / (MYFLT)self->chnls;
+            if (phase < 0.0)
+                phase += 1.0;
+            val = inval * MYPOW(Pan_window_lookup(PAN_COS_WINDOW, phase), sprd);
             self->buffer_streams[i+j*self->bufsize] = val;
         }
     }
@@ -167,7 +256,7 @@ Panner_splitter_ia(Panner *self) {
 
 static void
 Panner_splitter_aa(Panner *self) {
-    MYFLT val, inval, phase, spdval, sprd;
+    MYFLT val, inval, phase, spdval, sprd, panval;
     int j, i;
     MYFLT *in = Stream_getData((Stream *)self->input_stream);
 
@@ -179,9 +268,12 @@ Panner_splitter_aa(Panner *self) {
         inval = in[i];
         spdval = P_clip(spd[i]);
         sprd = 20.0 - (MYSQRT(spdval) * 20.0) + 0.1;
+        panval = P_clip(pan[i]);
         for (j=0; j<self->chnls; j++) {
-            phase = j / (MYFLT)self->chnls;
-            val = inval * MYPOW(MYCOS((P_clip(pan[i]) - phase) * TWOPI) * 0.5 + 0.5, sprd);
+            phase = panval - j / (MYFLT)self->chnls;
+            if (phase < 0.0)
+                phase += 1.0;
+            val = inval * MYPOW(Pan_window_lookup(PAN_COS_WINDOW, phase), sprd);
             self->buffer_streams[i+j*self->bufsize] = val;
         }
     }
@@ -267,6 +359,7 @@ Panner_dealloc(Panner* self)
 {
     pyo_DEALLOC
     free(self->buffer_streams);
+    free(self->gain_table);
     Panner_clear(self);
     self->ob_type->tp_free((PyObject*)self);
 }
@@ -279,6 +372,8 @@ Panner_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     Panner *self;
     self = (Panner *)type->tp_alloc(type, 0);
 
+    Pan_init_windows();
+
     INIT_OBJECT_COMMON
     Stream_setFunctionPtr(self->stream, Panner_compute_next_data_frame);
     self->mode_func_ptr = Panner_setProcMode;
@@ -310,6 +405,8 @@ Panner_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         self->chnls = 1;
 
     self->buffer_streams = (MYFLT *)realloc(self->buffer_streams, self->chnls * self->bufsize * sizeof(MYFLT));
+    self->gain_table = (MYFLT *)malloc((PAN_WINDOW_SIZE + 2) * sizeof(MYFLT));
+    self->gain_table_sprd = -1.0;
 
     (*self->mode_func_ptr)(self);
 
@@ -737,20 +834,13 @@ SPanner_splitter_thru(SPanner *self) {
 
 static void
 SPanner_splitter_st_i(SPanner *self) {
-    MYFLT val, inval;
-    int i;
     MYFLT *in = Stream_getData((Stream *)self->input_stream);
 
     MYFLT pan = PyFloat_AS_DOUBLE(self->pan);
     pan = P_clip(pan);
 
-    for (i=0; i<self->bufsize; i++) {
-        inval = in[i];
-        val = inval * MYSQRT(1.0 - pan);
-        self->buffer_streams[i] = val;
-        val = inval * MYSQRT(pan);
-        self->buffer_streams[i+self->bufsize] = val;
-    }
+    Pan_apply_gain(self->buffer_streams, in, MYSQRT(1.0 - pan), self->bufsize);
+    Pan_apply_gain(self->buffer_streams + self->bufsize, in, MYSQRT(pan), self->bufsize);
 }
 
 static void
@@ -764,16 +854,16 @@ SPanner_splitter_st_a(SPanner *self) {
     for (i=0; i<self->bufsize; i++) {
         inval = in[i];
         panval = P_clip(pan[i]);
-        val = inval * MYSQRT(1.0 - panval);
+        val = inval * Pan_window_lookup(PAN_SQRT_WINDOW, 1.0 - panval);
         self->buffer_streams[i] = val;
-        val = inval * MYSQRT(panval);
+        val = inval * Pan_window_lookup(PAN_SQRT_WINDOW, panval);
         self->buffer_streams[i+self->bufsize] = val;
     }
 }
 
 static void
 SPanner_splitter_i(SPanner *self) {
-    MYFLT val, inval, min, pan1, pan2;
+    MYFLT min, pan1, pan2;
     int j, i;
     MYFLT *in = Stream_getData((Stream *)self->input_stream);
     MYFLT pan = PyFloat_AS_DOUBLE(self->pan);
@@ -804,13 +894,8 @@ SPanner_splitter_i(SPanner *self) {
     pan = P_clip((pan - min) * self->chnls);
     pan1 = MYSQRT(1.0 - pan);
     pan2 = MYSQRT(pan);
-    for (i=0; i<self->bufsize; i++) {
-        inval = in[i];
-        val = inval * pan1;
-        self->buffer_streams[i+self->k1] = val;
-        val = inval * pan2;
-        self->buffer_streams[i+self->k2] = val;
-    }
+    Pan_apply_gain(self->buffer_streams + self->k1, in, pan1, self->bufsize);
+    Pan_apply_gain(self->buffer_streams + self->k2, in, pan2, self->bufsize);
 }
 
 static void
@@ -847,9 +932,9 @@ SPanner_splitter_a(SPanner *self) {
         }
 
         pan = P_clip((pan - min) * self->chnls);
-        val = inval * MYSQRT(1.0 - pan);
+        val = inval * Pan_window_lookup(PAN_SQRT_WINDOW, 1.0 - pan);
         self->buffer_streams[i+self->k1] = val;
-        val = inval * MYSQRT(pan);
+        val = inval * Pan_window_lookup(PAN_SQRT_WINDOW, pan);
         self->buffer_streams[i+self->k2] = val;
     }
 }
@@ -936,6 +1021,8 @@ SPanner_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     SPanner *self;
     self = (SPanner *)type->tp_alloc(type, 0);
 
+    Pan_init_windows();
+
     INIT_OBJECT_COMMON
     Stream_setFunctionPtr(self->stream, SPanner_compute_next_data_frame);
     self->mode_func_ptr = SPanner_setProcMode;
@@ -1360,7 +1447,7 @@ Switcher_clip_voice(Switcher *self, MYFLT v) {
 
 static void
 Switcher_splitter_i(Switcher *self) {
-    MYFLT val, inval, voice1, voice2;
+    MYFLT voice1, voice2;
     int j1, j, i;
     MYFLT *in = Stream_getData((Stream *)self->input_stream);
     MYFLT voice = Switcher_clip_voice(self, PyFloat_AS_DOUBLE(self->voice));
@@ -1383,13 +1470,8 @@ Switcher_splitter_i(Switcher *self) {
     voice1 = MYSQRT(1.0 - voice);
     voice2 = MYSQRT(voice);
 
-    for (i=0; i<self->bufsize; i++) {
-        inval = in[i];
-        val = inval * voice1;
-        self->buffer_streams[i+self->k1] = val;
-        val = inval * voice2;
-        self->buffer_streams[i+self->k2] = val;
-    }
+    Pan_apply_gain(self->buffer_streams + self->k1, in, voice1, self->bufsize);
+    Pan_apply_gain(self->buffer_streams + self->k2, in, voice2, self->bufsize);
 }
 
 static void
@@ -1408,19 +1490,18 @@ Switcher_splitter_a(Switcher *self) {
         voice = Switcher_clip_voice(self, avoice[i]);
         inval = in[i];
 
+        /* branchless step back when the voice pointer sits on the last channel */
         j1 = (int)voice;
+        j1 -= (j1 >= (self->chnls-1));
         j = j1 + 1;
-        if (j1 >= (self->chnls-1)) {
-            j1--; j--;
-        }
 
         self->k1 = j1 * self->bufsize;
         self->k2 = j * self->bufsize;
 
         voice = P_clip(voice - j1);
 
-        self->buffer_streams[i+self->k1] = inval * MYSQRT(1.0 - voice);
-        self->buffer_streams[i+self->k2] = inval * MYSQRT(voice);
+        self->buffer_streams[i+self->k1] = inval * Pan_window_lookup(PAN_SQRT_WINDOW, 1.0 - voice);
+        self->buffer_streams[i+self->k2] = inval * Pan_window_lookup(PAN_SQRT_WINDOW, voice);
     }
 }
 
@@ -1488,6 +1569,8 @@ Switcher_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     Switcher *self;
     self = (Switcher *)type->tp_alloc(type, 0);
 
+    Pan_init_windows();
+
     INIT_OBJECT_COMMON
     Stream_setFunctionPtr(self->stream, Switcher_compute_next_data_frame);
     self->mode_func_ptr = Switcher_setProcMode;
@@ -2873,11 +2956,11 @@ Selector_generate_a(Selector *self) {
     for (i=0; i<self->bufsize; i++) {
         voice = Selector_clip_voice(self, vc[i]);
 
+        /* branchless step back when the voice pointer sits on the last input */
         j1 = (int)voice;
+        j1 -= (j1 >= (self->chSize-1));
         j = j1 + 1;
-        if (j1 >= (self->chSize-1)) {
-            j1--; j--;
-        }
+
         if (j1 != old_j1) {
             st1 = Stream_getData((Stream *)PyObject_CallMethod((PyObject *)PyList_GET_ITEM(self->inputs, j1), "_getStream", NULL));
             old_j1 = j1;
@@ -2889,7 +2972,8 @@ Selector_generate_a(Selector *self) {
 
         voice = P_clip(voice - j1);
 
-        self->data[i] = st1[i] * MYSQRT(1.0 - voice) + st2[i] * MYSQRT(voice);
+        self->data[i] = st1[i] * Pan_window_lookup(PAN_SQRT_WINDOW, 1.0 - voice) +
+                        st2[i] * Pan_window_lookup(PAN_SQRT_WINDOW, voice);
     }
 }
 
@@ -2992,6 +3076,8 @@ Selector_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     Selector *self;
     self = (Selector *)type->tp_alloc(type, 0);
 
+    Pan_init_windows();
+
     self->voice = PyFloat_FromDouble(0.);
 	self->modebuffer[0] = 0;
 	self->modebuffer[1] = 0;
@@ -19,6 +19,8 @@
  *************************************************************************/
 
 #include <Python.h>
+#include <pthread.h>
+#include <time.h>
 #include "structmember.h"
 #include "pyomodule.h"
 #include "streammodule.h"
@@ -34,13 +36,90 @@ typedef struct {
     MYFLT sampleToSec;
     double currentTime;
     int init;
+    /* The callable runs on a dedicated worker thread, fed from the audio
+       thread through a single-producer/single-consumer event queue, so
+       that heavy Python callbacks never stall the DSP computation. Every
+       event is identical (a zero-argument call on `callable`), so the
+       queue carries no payload and reduces to a pair of single-writer
+       counters: the audio thread only ever advances `ring_head`, the
+       worker only ever advances `ring_tail`. When the worker falls more
+       than PATTERN_RING_SIZE events behind, new events are dropped and
+       counted in `missed` instead of blocking the audio thread. */
+    pthread_t worker;
+    pthread_mutex_t worker_mutex;
+    pthread_cond_t worker_cond;
+    int worker_running;
+    unsigned int ring_head;
+    unsigned int ring_tail;
+    unsigned int missed;
 } Pattern;
 
+#define PATTERN_RING_SIZE 256
+
+static void *
+Pattern_worker_thread(void *arg) {
+    Pattern *self = (Pattern *)arg;
+    PyGILState_STATE s;
+    PyObject *result;
+    struct timespec deadline;
+    unsigned int tail;
+
+    pthread_mutex_lock(&self->worker_mutex);
+    while (self->worker_running == 1) {
+        tail = self->ring_tail;
+        if (tail == __atomic_load_n(&self->ring_head, __ATOMIC_ACQUIRE)) {
+            /* The audio thread posts without taking the mutex, so a
+               signal can be missed; the timeout bounds that delay. */
+            clock_gettime(CLOCK_REALTIME, &deadline);
+            deadline.tv_nsec += 2000000;
+            if (deadline.tv_nsec >= 1000000000) {
+                deadline.tv_nsec -= 1000000000;
+                deadline.tv_sec += 1;
+            }
+            pthread_cond_timedwait(&self->worker_cond, &self->worker_mutex, &deadline);
+            continue;
+        }
+        pthread_mutex_unlock(&self->worker_mutex);
+
+        while (tail != __atomic_load_n(&self->ring_head, __ATOMIC_ACQUIRE)) {
+            s = PyGILState_Ensure();
+            result = PyObject_Call((PyObject *)self->callable, PyTuple_New(0), NULL);
+            if (result == NULL)
+                PyErr_Print();
+            else
+                Py_DECREF(result);
+            PyGILState_Release(s);
+            tail++;
+            __atomic_store_n(&self->ring_tail, tail, __ATOMIC_RELEASE);
+        }
+
+        pthread_mutex_lock(&self->worker_mutex);
+    }
+    pthread_mutex_unlock(&self->worker_mutex);
+    return NULL;
+}
+
+static void
+Pattern_post_event(Pattern *self) {
+    unsigned int head = self->ring_head;
+
+    if ((head - __atomic_load_n(&self->ring_tail, __ATOMIC_ACQUIRE)) >= PATTERN_RING_SIZE) {
+        self->missed++;
+        return;
+    }
+    __atomic_store_n(&self->ring_head, head + 1, __ATOMIC_RELEASE);
+    /* Wake the worker if it is idle; if the trylock fails the worker is
+       already awake and will pick the event up on its next pass. */
+    if (pthread_mutex_trylock(&self->worker_mutex) == 0) {
+        pthread_cond_signal(&self->worker_cond);
+        pthread_mutex_unlock(&self->worker_mutex);
+    }
+}
+
 static void
 Pattern_generate_i(Pattern *self) {
     MYFLT tm;
     int i, flag;
-    PyObject *result;
 
     flag = 0;
     tm = PyFloat_AS_DOUBLE(self->time);
@@ -55,16 +134,13 @@ Pattern_generate_i(Pattern *self) {
     }
     if (flag == 1 || self->init == 1) {
         self->init = 0;
-        result = PyObject_Call((PyObject *)self->callable, PyTuple_New(0), NULL);
-        if (result == NULL)
-            PyErr_Print();
+        Pattern_post_event(self);
     }
 }
 
 static void
 Pattern_generate_a(Pattern *self) {
     int i, flag;
-    PyObject *result;
 
     MYFLT *tm = Stream_getData((Stream *)self->time_stream);
 
@@ -79,9 +155,7 @@ Pattern_generate_a(Pattern *self) {
     }
     if (flag == 1 || self->init == 1) {
         self->init = 0;
-        result = PyObject_Call((PyObject *)self->callable, PyTuple_New(0), NULL);
-        if (result == NULL)
-            PyErr_Print();
+        Pattern_post_event(self);
     }
 }
 
@@ -129,6 +203,17 @@ Pattern_clear(Pattern *self)
 static void
 Pattern_dealloc(Pattern* self)
 {
+    if (self->worker_running == 1) {
+        pthread_mutex_lock(&self->worker_mutex);
+        self->worker_running = 0;
+        pthread_cond_signal(&self->worker_cond);
+        pthread_mutex_unlock(&self->worker_mutex);
+        Py_BEGIN_ALLOW_THREADS
+        pthread_join(self->worker, NULL);
+        Py_END_ALLOW_THREADS
+        pthread_cond_destroy(&self->worker_cond);
+        pthread_mutex_destroy(&self->worker_mutex);
+    }
     pyo_DEALLOC
     Pattern_clear(self);
     self->ob_type->tp_free((PyObject*)self);
@@ -172,6 +257,13 @@ Pattern_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 
     (*self->mode_func_ptr)(self);
 
+    PyEval_InitThreads();
+    pthread_mutex_init(&self->worker_mutex, NULL);
+    pthread_cond_init(&self->worker_cond, NULL);
+    self->ring_head = self->ring_tail = self->missed = 0;
+    self->worker_running = 1;
+    pthread_create(&self->worker, NULL, Pattern_worker_thread, self);
+
     return (PyObject *)self;
 }
 
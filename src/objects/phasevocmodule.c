@@ -35,6 +35,78 @@ isPowerOfTwo(int x) {
     return (x != 0) && ((x & (x - 1)) == 0);
 }
 
+/* Windowing kernels for the STFT hop loops. The frame rotation index
+   (k+mod)%size is resolved by the callers into two contiguous runs, so
+   these kernels always see unit-stride data. */
+#if !defined(USE_DOUBLE) && defined(__AVX__)
+#include <immintrin.h>
+static void
+PV_window_mult(MYFLT *out, MYFLT *in, MYFLT *win, int n) {
+    int i;
+    for (i=0; i<=n-8; i+=8) {
+        _mm256_storeu_ps(out+i, _mm256_mul_ps(_mm256_loadu_ps(in+i), _mm256_loadu_ps(win+i)));
+    }
+    for (; i<n; i++) {
+        out[i] = in[i] * win[i];
+    }
+}
+static void
+PV_window_mult_add(MYFLT *acc, MYFLT *in, MYFLT *win, MYFLT scl, int n) {
+    int i;
+    __m256 t, g = _mm256_set1_ps(scl);
+    for (i=0; i<=n-8; i+=8) {
+        t = _mm256_mul_ps(_mm256_loadu_ps(in+i), _mm256_loadu_ps(win+i));
+#if defined(__FMA__)
+        _mm256_storeu_ps(acc+i, _mm256_fmadd_ps(t, g, _mm256_loadu_ps(acc+i)));
+#else
+        _mm256_storeu_ps(acc+i, _mm256_add_ps(_mm256_loadu_ps(acc+i), _mm256_mul_ps(t, g)));
+#endif
+    }
+    for (; i<n; i++) {
+        acc[i] += in[i] * win[i] * scl;
+    }
+}
+#elif !defined(USE_DOUBLE) && defined(__SSE2__)
+#include <emmintrin.h>
+static void
+PV_window_mult(MYFLT *out, MYFLT *in, MYFLT *win, int n) {
+    int i;
+    for (i=0; i<=n-4; i+=4) {
+        _mm_storeu_ps(out+i, _mm_mul_ps(_mm_loadu_ps(in+i), _mm_loadu_ps(win+i)));
+    }
+    for (; i<n; i++) {
+        out[i] = in[i] * win[i];
+    }
+}
+static void
+PV_window_mult_add(MYFLT *acc, MYFLT *in, MYFLT *win, MYFLT scl, int n) {
+    int i;
+    __m128 g = _mm_set1_ps(scl);
+    for (i=0; i<=n-4; i+=4) {
+        _mm_storeu_ps(acc+i, _mm_add_ps(_mm_loadu_ps(acc+i),
+            _mm_mul_ps(_mm_mul_ps(_mm_loadu_ps(in+i), _mm_loadu_ps(win+i)), g)));
+    }
+    for (; i<n; i++) {
+        acc[i] += in[i] * win[i] * scl;
+    }
+}
+#else
+static void
+PV_window_mult(MYFLT *out, MYFLT *in, MYFLT *win, int n) {
+    int i;
+    for (i=0; i<n; i++) {
+        out[i] = in[i] * win[i];
+    }
+}
+static void
+PV_window_mult_add(MYFLT *acc, MYFLT *in, MYFLT *win, MYFLT scl, int n) {
+    int i;
+    for (i=0; i<n; i++) {
+        acc[i] += in[i] * win[i] * scl;
+    }
+}
+#endif
+
 typedef struct {
     pyo_audio_HEAD
     PyObject *input;
@@ -66,7 +138,7 @@ typedef struct {
 
 static void
 PVAnal_realloc_memories(PVAnal *self) {
-    int i, j, n8;
+    int i, j;
     self->hsize = self->size / 2;
     self->hopsize = self->size / self->olaps;
     self->factor = self->sr / (self->hopsize * TWOPI);
@@ -74,7 +146,6 @@ PVAnal_realloc_memories(PVAnal *self) {
     self->inputLatency = self->size - self->hopsize;
     self->incount = self->inputLatency;
     self->overcount = 0;
-    n8 = self->size >> 3;
     self->input_buffer = (MYFLT *)realloc(self->input_buffer, self->size * sizeof(MYFLT));
     self->inframe = (MYFLT *)realloc(self->inframe, self->size * sizeof(MYFLT));
     self->outframe = (MYFLT *)realloc(self->outframe, self->size * sizeof(MYFLT));
@@ -93,12 +164,8 @@ PVAnal_realloc_memories(PVAnal *self) {
     }
     for (i=0; i<self->hsize; i++)
         self->lastPhase[i] = self->real[i] = self->imag[i] = 0.0;
-    self->twiddle = (MYFLT **)realloc(self->twiddle, 4 * sizeof(MYFLT *));
-    for(i=0; i<4; i++)
-        self->twiddle[i] = (MYFLT *)malloc(n8 * sizeof(MYFLT));
-    fft_compute_split_twiddle(self->twiddle, self->size);
-    self->window = (MYFLT *)realloc(self->window, self->size * sizeof(MYFLT));
-    gen_window(self->window, self->size, self->wintype);
+    self->twiddle = fft_get_shared_twiddle(self->size);
+    self->window = gen_get_shared_window(self->size, self->wintype);
     for (i=0; i<self->bufsize; i++)
         self->count[i] = self->incount;
     PVStream_setFFTsize(self->pv_stream, self->size);
@@ -121,9 +188,8 @@ PVAnal_process(PVAnal *self) {
         if (self->incount >= self->size) {
             self->incount = self->inputLatency;
             mod = self->hopsize * self->overcount;
-            for (k=0; k<self->size; k++) {
-                self->inframe[(k+mod)%self->size] = self->input_buffer[k] * self->window[k];
-            }
+            PV_window_mult(self->inframe + mod, self->input_buffer, self->window, self->size - mod);
+            PV_window_mult(self->inframe, self->input_buffer + self->size - mod, self->window + self->size - mod, mod);
             realfft_split(self->inframe, self->outframe, self->size, self->twiddle);
             self->real[0] = self->outframe[0];
             self->imag[0] = 0.0;
@@ -197,11 +263,6 @@ PVAnal_dealloc(PVAnal* self)
     free(self->real);
     free(self->imag);
     free(self->lastPhase);
-    for(i=0; i<4; i++) {
-        free(self->twiddle[i]);
-    }
-    free(self->twiddle);
-    free(self->window);
     for(i=0; i<self->olaps; i++) {
         free(self->magn[i]);
         free(self->freq[i]);
@@ -308,7 +369,7 @@ PVAnal_setWinType(PVAnal *self, PyObject *arg)
 {
     if (PyLong_Check(arg) || PyInt_Check(arg)) {
         self->wintype = PyInt_AsLong(arg);
-        gen_window(self->window, self->size, self->wintype);
+        self->window = gen_get_shared_window(self->size, self->wintype);
     }
 
     Py_INCREF(Py_None);
@@ -410,7 +471,7 @@ typedef struct {
 
 static void
 PVSynth_realloc_memories(PVSynth *self) {
-    int i, n8;
+    int i;
     self->hsize = self->size / 2;
     self->hopsize = self->size / self->olaps;
     self->factor = self->hopsize * TWOPI / self->sr;
@@ -418,7 +479,6 @@ PVSynth_realloc_memories(PVSynth *self) {
     self->inputLatency = self->size - self->hopsize;
     self->overcount = 0;
     self->ampscl = 1.0 / MYSQRT(self->olaps);
-    n8 = self->size >> 3;
     self->output_buffer = (MYFLT *)realloc(self->output_buffer, self->size * sizeof(MYFLT));
     self->inframe = (MYFLT *)realloc(self->inframe, self->size * sizeof(MYFLT));
     self->outframe = (MYFLT *)realloc(self->outframe, self->size * sizeof(MYFLT));
@@ -432,12 +492,8 @@ PVSynth_realloc_memories(PVSynth *self) {
     self->outputAccum = (MYFLT *)realloc(self->outputAccum, (self->size+self->hopsize) * sizeof(MYFLT));
     for (i=0; i<(self->size+self->hopsize); i++)
         self->outputAccum[i] = 0.0;
-    self->twiddle = (MYFLT **)realloc(self->twiddle, 4 * sizeof(MYFLT *));
-    for(i=0; i<4; i++)
-        self->twiddle[i] = (MYFLT *)malloc(n8 * sizeof(MYFLT));
-    fft_compute_split_twiddle(self->twiddle, self->size);
-    self->window = (MYFLT *)realloc(self->window, self->size * sizeof(MYFLT));
-    gen_window(self->window, self->size, self->wintype);
+    self->twiddle = fft_get_shared_twiddle(self->size);
+    self->window = gen_get_shared_window(self->size, self->wintype);
 }
 
 static void
@@ -477,9 +533,8 @@ PVSynth_process(PVSynth *self) {
             }
             irealfft_split(self->inframe, self->outframe, self->size, self->twiddle);
             mod = self->hopsize * self->overcount;
-            for (k=0; k<self->size; k++) {
-                self->outputAccum[k] += self->outframe[(k+mod)%self->size] * self->window[k] * self->ampscl;
-            }
+            PV_window_mult_add(self->outputAccum, self->outframe + mod, self->window, self->ampscl, self->size - mod);
+            PV_window_mult_add(self->outputAccum + self->size - mod, self->outframe, self->window + self->size - mod, self->ampscl, mod);
             for (k=0; k<self->hopsize; k++) {
                 self->output_buffer[k] = self->outputAccum[k];
             }
@@ -572,7 +627,6 @@ PVSynth_clear(PVSynth *self)
 static void
 PVSynth_dealloc(PVSynth* self)
 {
-    int i;
     pyo_DEALLOC
     free(self->output_buffer);
     free(self->outputAccum);
@@ -581,11 +635,6 @@ PVSynth_dealloc(PVSynth* self)
     free(self->real);
     free(self->imag);
     free(self->sumPhase);
-    for(i=0; i<4; i++) {
-        free(self->twiddle[i]);
-    }
-    free(self->twiddle);
-    free(self->window);
     PVSynth_clear(self);
     self->ob_type->tp_free((PyObject*)self);
 }
@@ -671,7 +720,7 @@ PVSynth_setWinType(PVSynth *self, PyObject *arg)
 {
     if (PyLong_Check(arg) || PyInt_Check(arg)) {
         self->wintype = PyInt_AsLong(arg);
-        gen_window(self->window, self->size, self->wintype);
+        self->window = gen_get_shared_window(self->size, self->wintype);
     }
 
     Py_INCREF(Py_None);
@@ -858,7 +907,7 @@ PVAddSynth_realloc_memories(PVAddSynth *self) {
 static void
 PVAddSynth_process_i(PVAddSynth *self) {
     int i, k, n, bin, ipart;
-    MYFLT pitch, tamp, tfreq, inca, incf, ratio, fpart;
+    MYFLT pitch, tamp, tfreq, inca, incf, ratio, fpart, opos, oamp, ofreq;
     MYFLT **magn = PVStream_getMagn((PVStream *)self->input_stream);
     MYFLT **freq = PVStream_getFreq((PVStream *)self->input_stream);
     int *count = PVStream_getCount((PVStream *)self->input_stream);
@@ -887,16 +936,26 @@ PVAddSynth_process_i(PVAddSynth *self) {
                     tfreq = freq[self->overcount][bin] * pitch;
                     inca = (tamp - self->amp[k]) / self->hopsize;
                     incf = (tfreq - self->freq[k]) / self->hopsize;
+                    /* keep the oscillator state in registers over the
+                       hop; outbuf and the state arrays share the MYFLT
+                       type, so the compiler must otherwise reload them
+                       on every sample */
+                    opos = self->ppos[k];
+                    oamp = self->amp[k];
+                    ofreq = self->freq[k];
                     for (n=0; n<self->hopsize; n++) {
-                        self->ppos[k] += self->freq[k] * ratio;
-                        while (self->ppos[k] < 0.0) self->ppos[k] += 8192.0;
-                        while (self->ppos[k] >= 8192.0) self->ppos[k] -= 8192.0;
-                        ipart = (int)self->ppos[k];
-                        fpart = self->ppos[k] - ipart;
-                        self->outbuf[n] += self->amp[k] * (self->table[ipart] + (self->table[ipart+1] - self->table[ipart]) * fpart);
-                        self->amp[k] += inca;
-                        self->freq[k] += incf;
+                        opos += ofreq * ratio;
+                        while (opos < 0.0) opos += 8192.0;
+                        while (opos >= 8192.0) opos -= 8192.0;
+                        ipart = (int)opos;
+                        fpart = opos - ipart;
+                        self->outbuf[n] += oamp * (self->table[ipart] + (self->table[ipart+1] - self->table[ipart]) * fpart);
+                        oamp += inca;
+                        ofreq += incf;
                     }
+                    self->ppos[k] = opos;
+                    self->amp[k] = oamp;
+                    self->freq[k] = ofreq;
                 }
             }
             self->overcount++;
@@ -909,7 +968,7 @@ PVAddSynth_process_i(PVAddSynth *self) {
 static void
 PVAddSynth_process_a(PVAddSynth *self) {
     int i, k, n, bin, ipart;
-    MYFLT pitch, tamp, tfreq, inca, incf, ratio, fpart;
+    MYFLT pitch, tamp, tfreq, inca, incf, ratio, fpart, opos, oamp, ofreq;
     MYFLT **magn = PVStream_getMagn((PVStream *)self->input_stream);
     MYFLT **freq = PVStream_getFreq((PVStream *)self->input_stream);
     int *count = PVStream_getCount((PVStream *)self->input_stream);
@@ -939,16 +998,26 @@ PVAddSynth_process_a(PVAddSynth *self) {
                     tfreq = freq[self->overcount][bin] * pitch;
                     inca = (tamp - self->amp[k]) / self->hopsize;
                     incf = (tfreq - self->freq[k]) / self->hopsize;
+                    /* keep the oscillator state in registers over the
+                       hop; outbuf and the state arrays share the MYFLT
+                       type, so the compiler must otherwise reload them
+                       on every sample */
+                    opos = self->ppos[k];
+                    oamp = self->amp[k];
+                    ofreq = self->freq[k];
                     for (n=0; n<self->hopsize; n++) {
-                        self->ppos[k] += self->freq[k] * ratio;
-                        while (self->ppos[k] < 0.0) self->ppos[k] += 8192.0;
-                        while (self->ppos[k] >= 8192.0) self->ppos[k] -= 8192.0;
-                        ipart = (int)self->ppos[k];
-                        fpart = self->ppos[k] - ipart;
-                        self->outbuf[n] += self->amp[k] * (self->table[ipart] + (self->table[ipart+1] - self->table[ipart]) * fpart);
-                        self->amp[k] += inca;
-                        self->freq[k] += incf;
+                        opos += ofreq * ratio;
+                        while (opos < 0.0) opos += 8192.0;
+                        while (opos >= 8192.0) opos -= 8192.0;
+                        ipart = (int)opos;
+                        fpart = opos - ipart;
+                        self->outbuf[n] += oamp * (self->table[ipart] + (self->table[ipart+1] - self->table[ipart]) * fpart);
+                        oamp += inca;
+                        ofreq += incf;
                     }
+                    self->ppos[k] = opos;
+                    self->amp[k] = oamp;
+                    self->freq[k] = ofreq;
                 }
             }
             self->overcount++;
@@ -1741,6 +1810,9 @@ typedef struct {
     int overcount;
     MYFLT *l_magn;
     MYFLT *l_freq;
+    MYFLT *gain_curve;
+    MYFLT curve_revtime;
+    MYFLT curve_damp;
     MYFLT **magn;
     MYFLT **freq;
     int *count;
@@ -1756,6 +1828,8 @@ PVVerb_realloc_memories(PVVerb *self) {
     self->overcount = 0;
     self->l_magn = (MYFLT *)realloc(self->l_magn, self->hsize * sizeof(MYFLT));
     self->l_freq = (MYFLT *)realloc(self->l_freq, self->hsize * sizeof(MYFLT));
+    self->gain_curve = (MYFLT *)realloc(self->gain_curve, self->hsize * sizeof(MYFLT));
+    self->curve_revtime = -1.0;
     for (i=0; i<self->hsize; i++)
         self->l_magn[i] = self->l_freq[i] = 0.0;
     self->magn = (MYFLT **)realloc(self->magn, self->olaps * sizeof(MYFLT *));
@@ -1775,10 +1849,121 @@ PVVerb_realloc_memories(PVVerb *self) {
     PVStream_setCount(self->pv_stream, self->count);
 }
 
+/* The per-bin smoothing factor revtime * damp^k depends only on the
+   frame's revtime and damp values (already clipped and mapped by the
+   callers), so it is tabulated once and rebuilt only when one of them
+   changes, like the panner gain table. */
+static void
+PVVerb_update_gain_curve(PVVerb *self, MYFLT revtime, MYFLT damp) {
+    int k;
+    MYFLT amp = 1.0;
+    if (self->curve_revtime == revtime && self->curve_damp == damp)
+        return;
+    for (k=0; k<self->hsize; k++) {
+        self->gain_curve[k] = revtime * amp;
+        amp *= damp;
+    }
+    self->curve_revtime = revtime;
+    self->curve_damp = damp;
+}
+
+/* One smoothing pass over a frame, updating the l_magn/l_freq state in
+   place. A rising magnitude resets the decay; the smoothed value is
+   always below the input there, so the magnitudes reduce to a max and
+   only the frequencies need the comparison mask. */
+#if !defined(USE_DOUBLE) && defined(__AVX__)
+static void
+PVVerb_apply(MYFLT *out_magn, MYFLT *out_freq, MYFLT *l_magn, MYFLT *l_freq,
+             MYFLT *in_magn, MYFLT *in_freq, MYFLT *gain, int n) {
+    int k;
+    __m256 m, f, lm, lf, g, sm, sf, rising;
+    for (k=0; k<=n-8; k+=8) {
+        m = _mm256_loadu_ps(in_magn+k);
+        f = _mm256_loadu_ps(in_freq+k);
+        lm = _mm256_loadu_ps(l_magn+k);
+        lf = _mm256_loadu_ps(l_freq+k);
+        g = _mm256_loadu_ps(gain+k);
+#if defined(__FMA__)
+        sm = _mm256_fmadd_ps(_mm256_sub_ps(lm, m), g, m);
+        sf = _mm256_fmadd_ps(_mm256_sub_ps(lf, f), g, f);
+#else
+        sm = _mm256_add_ps(m, _mm256_mul_ps(_mm256_sub_ps(lm, m), g));
+        sf = _mm256_add_ps(f, _mm256_mul_ps(_mm256_sub_ps(lf, f), g));
+#endif
+        rising = _mm256_cmp_ps(m, lm, _CMP_GT_OQ);
+        sm = _mm256_max_ps(m, sm);
+        sf = _mm256_blendv_ps(sf, f, rising);
+        _mm256_storeu_ps(out_magn+k, sm);
+        _mm256_storeu_ps(l_magn+k, sm);
+        _mm256_storeu_ps(out_freq+k, sf);
+        _mm256_storeu_ps(l_freq+k, sf);
+    }
+    for (; k<n; k++) {
+        if (in_magn[k] > l_magn[k]) {
+            out_magn[k] = l_magn[k] = in_magn[k];
+            out_freq[k] = l_freq[k] = in_freq[k];
+        }
+        else {
+            out_magn[k] = l_magn[k] = in_magn[k] + (l_magn[k] - in_magn[k]) * gain[k];
+            out_freq[k] = l_freq[k] = in_freq[k] + (l_freq[k] - in_freq[k]) * gain[k];
+        }
+    }
+}
+#elif !defined(USE_DOUBLE) && defined(__SSE2__)
+static void
+PVVerb_apply(MYFLT *out_magn, MYFLT *out_freq, MYFLT *l_magn, MYFLT *l_freq,
+             MYFLT *in_magn, MYFLT *in_freq, MYFLT *gain, int n) {
+    int k;
+    __m128 m, f, lm, lf, g, sm, sf, rising;
+    for (k=0; k<=n-4; k+=4) {
+        m = _mm_loadu_ps(in_magn+k);
+        f = _mm_loadu_ps(in_freq+k);
+        lm = _mm_loadu_ps(l_magn+k);
+        lf = _mm_loadu_ps(l_freq+k);
+        g = _mm_loadu_ps(gain+k);
+        sm = _mm_add_ps(m, _mm_mul_ps(_mm_sub_ps(lm, m), g));
+        sf = _mm_add_ps(f, _mm_mul_ps(_mm_sub_ps(lf, f), g));
+        rising = _mm_cmpgt_ps(m, lm);
+        sm = _mm_max_ps(m, sm);
+        sf = _mm_or_ps(_mm_and_ps(rising, f), _mm_andnot_ps(rising, sf));
+        _mm_storeu_ps(out_magn+k, sm);
+        _mm_storeu_ps(l_magn+k, sm);
+        _mm_storeu_ps(out_freq+k, sf);
+        _mm_storeu_ps(l_freq+k, sf);
+    }
+    for (; k<n; k++) {
+        if (in_magn[k] > l_magn[k]) {
+            out_magn[k] = l_magn[k] = in_magn[k];
+            out_freq[k] = l_freq[k] = in_freq[k];
+        }
+        else {
+            out_magn[k] = l_magn[k] = in_magn[k] + (l_magn[k] - in_magn[k]) * gain[k];
+            out_freq[k] = l_freq[k] = in_freq[k] + (l_freq[k] - in_freq[k]) * gain[k];
+        }
+    }
+}
+#else
+static void
+PVVerb_apply(MYFLT *out_magn, MYFLT *out_freq, MYFLT *l_magn, MYFLT *l_freq,
+             MYFLT *in_magn, MYFLT *in_freq, MYFLT *gain, int n) {
+    int k;
+    for (k=0; k<n; k++) {
+        if (in_magn[k] > l_magn[k]) {
+            out_magn[k] = l_magn[k] = in_magn[k];
+            out_freq[k] = l_freq[k] = in_freq[k];
+        }
+        else {
+            out_magn[k] = l_magn[k] = in_magn[k] + (l_magn[k] - in_magn[k]) * gain[k];
+            out_freq[k] = l_freq[k] = in_freq[k] + (l_freq[k] - in_freq[k]) * gain[k];
+        }
+    }
+}
+#endif
+
 static void
 PVVerb_process_ii(PVVerb *self) {
-    int i, k;
-    MYFLT revtime, damp, mag, amp, fre;
+    int i;
+    MYFLT revtime, damp;
     MYFLT **magn = PVStream_getMagn((PVStream *)self->input_stream);
     MYFLT **freq = PVStream_getFreq((PVStream *)self->input_stream);
     int *count = PVStream_getCount((PVStream *)self->input_stream);
@@ -1806,20 +1991,11 @@ PVVerb_process_ii(PVVerb *self) {
     for (i=0; i<self->bufsize; i++) {
         self->count[i] = count[i];
         if (count[i] >= (self->size-1)) {
-            amp = 1.0;
-            for (k=0; k<self->hsize; k++) {
-                mag = magn[self->overcount][k];
-                fre = freq[self->overcount][k];
-                if (mag > self->l_magn[k]) {
-                    self->magn[self->overcount][k] = self->l_magn[k] = mag;
-                    self->freq[self->overcount][k] = self->l_freq[k] = fre;
-                }
-                else {
-                    self->magn[self->overcount][k] = self->l_magn[k] = mag + (self->l_magn[k] - mag) * revtime * amp;
-                    self->freq[self->overcount][k] = self->l_freq[k] = fre + (self->l_freq[k] - fre) * revtime * amp;
-                }
-                amp *= damp;
-            }
+            PVVerb_update_gain_curve(self, revtime, damp);
+            PVVerb_apply(self->magn[self->overcount], self->freq[self->overcount],
+                         self->l_magn, self->l_freq,
+                         magn[self->overcount], freq[self->overcount],
+                         self->gain_curve, self->hsize);
             self->overcount++;
             if (self->overcount >= self->olaps)
                 self->overcount = 0;
@@ -1829,8 +2005,8 @@ PVVerb_process_ii(PVVerb *self) {
 
 static void
 PVVerb_process_ai(PVVerb *self) {
-    int i, k;
-    MYFLT revtime, damp, mag, amp, fre;
+    int i;
+    MYFLT revtime, damp;
     MYFLT **magn = PVStream_getMagn((PVStream *)self->input_stream);
     MYFLT **freq = PVStream_getFreq((PVStream *)self->input_stream);
     int *count = PVStream_getCount((PVStream *)self->input_stream);
@@ -1859,20 +2035,11 @@ PVVerb_process_ai(PVVerb *self) {
             else if (revtime > 1.0)
                 revtime = 1.0;
             revtime = revtime * 0.25 + 0.75;
-            amp = 1.0;
-            for (k=0; k<self->hsize; k++) {
-                mag = magn[self->overcount][k];
-                fre = freq[self->overcount][k];
-                if (mag > self->l_magn[k]) {
-                    self->magn[self->overcount][k] = self->l_magn[k] = mag;
-                    self->freq[self->overcount][k] = self->l_freq[k] = fre;
-                }
-                else {
-                    self->magn[self->overcount][k] = self->l_magn[k] = mag + (self->l_magn[k] - mag) * revtime * amp;
-                    self->freq[self->overcount][k] = self->l_freq[k] = fre + (self->l_freq[k] - fre) * revtime * amp;
-                }
-                amp *= damp;
-            }
+            PVVerb_update_gain_curve(self, revtime, damp);
+            PVVerb_apply(self->magn[self->overcount], self->freq[self->overcount],
+                         self->l_magn, self->l_freq,
+                         magn[self->overcount], freq[self->overcount],
+                         self->gain_curve, self->hsize);
             self->overcount++;
             if (self->overcount >= self->olaps)
                 self->overcount = 0;
@@ -1882,8 +2049,8 @@ PVVerb_process_ai(PVVerb *self) {
 
 static void
 PVVerb_process_ia(PVVerb *self) {
-    int i, k;
-    MYFLT revtime, damp, mag, amp, fre;
+    int i;
+    MYFLT revtime, damp;
     MYFLT **magn = PVStream_getMagn((PVStream *)self->input_stream);
     MYFLT **freq = PVStream_getFreq((PVStream *)self->input_stream);
     int *count = PVStream_getCount((PVStream *)self->input_stream);
@@ -1912,20 +2079,11 @@ PVVerb_process_ia(PVVerb *self) {
             else if (damp > 1.0)
                 damp = 1.0;
             damp = damp * 0.003 + 0.997;
-            amp = 1.0;
-            for (k=0; k<self->hsize; k++) {
-                mag = magn[self->overcount][k];
-                fre = freq[self->overcount][k];
-                if (mag > self->l_magn[k]) {
-                    self->magn[self->overcount][k] = self->l_magn[k] = mag;
-                    self->freq[self->overcount][k] = self->l_freq[k] = fre;
-                }
-                else {
-                    self->magn[self->overcount][k] = self->l_magn[k] = mag + (self->l_magn[k] - mag) * revtime * amp;
-                    self->freq[self->overcount][k] = self->l_freq[k] = fre + (self->l_freq[k] - fre) * revtime * amp;
-                }
-                amp *= damp;
-            }
+            PVVerb_update_gain_curve(self, revtime, damp);
+            PVVerb_apply(self->magn[self->overcount], self->freq[self->overcount],
+                         self->l_magn, self->l_freq,
+                         magn[self->overcount], freq[self->overcount],
+                         self->gain_curve, self->hsize);
             self->overcount++;
             if (self->overcount >= self->olaps)
                 self->overcount = 0;
@@ -1935,8 +2093,8 @@ PVVerb_process_ia(PVVerb *self) {
 
 static void
 PVVerb_process_aa(PVVerb *self) {
-    int i, k;
-    MYFLT revtime, damp, mag, amp, fre;
+    int i;
+    MYFLT revtime, damp;
     MYFLT **magn = PVStream_getMagn((PVStream *)self->input_stream);
     MYFLT **freq = PVStream_getFreq((PVStream *)self->input_stream);
     int *count = PVStream_getCount((PVStream *)self->input_stream);
@@ -1966,20 +2124,11 @@ PVVerb_process_aa(PVVerb *self) {
             else if (damp > 1.0)
                 damp = 1.0;
             damp = damp * 0.003 + 0.997;
-            amp = 1.0;
-            for (k=0; k<self->hsize; k++) {
-                mag = magn[self->overcount][k];
-                fre = freq[self->overcount][k];
-                if (mag > self->l_magn[k]) {
-                    self->magn[self->overcount][k] = self->l_magn[k] = mag;
-                    self->freq[self->overcount][k] = self->l_freq[k] = fre;
-                }
-                else {
-                    self->magn[self->overcount][k] = self->l_magn[k] = mag + (self->l_magn[k] - mag) * revtime * amp;
-                    self->freq[self->overcount][k] = self->l_freq[k] = fre + (self->l_freq[k] - fre) * revtime * amp;
-                }
-                amp *= damp;
-            }
+            PVVerb_update_gain_curve(self, revtime, damp);
+            PVVerb_apply(self->magn[self->overcount], self->freq[self->overcount],
+                         self->l_magn, self->l_freq,
+                         magn[self->overcount], freq[self->overcount],
+                         self->gain_curve, self->hsize);
             self->overcount++;
             if (self->overcount >= self->olaps)
                 self->overcount = 0;
@@ -2056,6 +2205,7 @@ PVVerb_dealloc(PVVerb* self)
     free(self->freq);
     free(self->l_magn);
     free(self->l_freq);
+    free(self->gain_curve);
     free(self->count);
     PVVerb_clear(self);
     self->ob_type->tp_free((PyObject*)self);
@@ -2283,6 +2433,48 @@ PVVerb_new,                                     /* tp_new */
 /*****************/
 /** PVGate **/
 /*****************/
+/* Gate pass over one frame: out[k] = in[k] < thresh ? in[k] * damp : in[k].
+   Spectral magnitudes make the scalar branch unpredictable, so the
+   SIMD variants blend the two results instead of branching. */
+#if !defined(USE_DOUBLE) && defined(__AVX__)
+static void
+PVGate_apply(MYFLT *out, MYFLT *in, MYFLT thresh, MYFLT damp, int n) {
+    int k;
+    __m256 m, below, vthr = _mm256_set1_ps(thresh), vdamp = _mm256_set1_ps(damp);
+    for (k=0; k<=n-8; k+=8) {
+        m = _mm256_loadu_ps(in+k);
+        below = _mm256_cmp_ps(m, vthr, _CMP_LT_OQ);
+        _mm256_storeu_ps(out+k, _mm256_blendv_ps(m, _mm256_mul_ps(m, vdamp), below));
+    }
+    for (; k<n; k++) {
+        out[k] = in[k] < thresh ? in[k] * damp : in[k];
+    }
+}
+#elif !defined(USE_DOUBLE) && defined(__SSE2__)
+static void
+PVGate_apply(MYFLT *out, MYFLT *in, MYFLT thresh, MYFLT damp, int n) {
+    int k;
+    __m128 m, md, below, vthr = _mm_set1_ps(thresh), vdamp = _mm_set1_ps(damp);
+    for (k=0; k<=n-4; k+=4) {
+        m = _mm_loadu_ps(in+k);
+        below = _mm_cmplt_ps(m, vthr);
+        md = _mm_mul_ps(m, vdamp);
+        _mm_storeu_ps(out+k, _mm_or_ps(_mm_and_ps(below, md), _mm_andnot_ps(below, m)));
+    }
+    for (; k<n; k++) {
+        out[k] = in[k] < thresh ? in[k] * damp : in[k];
+    }
+}
+#else
+static void
+PVGate_apply(MYFLT *out, MYFLT *in, MYFLT thresh, MYFLT damp, int n) {
+    int k;
+    for (k=0; k<n; k++) {
+        out[k] = in[k] < thresh ? in[k] * damp : in[k];
+    }
+}
+#endif
+
 typedef struct {
     pyo_audio_HEAD
     PyObject *input;
@@ -2329,8 +2521,8 @@ PVGate_realloc_memories(PVGate *self) {
 
 static void
 PVGate_process_ii(PVGate *self) {
-    int i, k;
-    MYFLT thresh, damp, mag;
+    int i;
+    MYFLT thresh, damp;
     MYFLT **magn = PVStream_getMagn((PVStream *)self->input_stream);
     MYFLT **freq = PVStream_getFreq((PVStream *)self->input_stream);
     int *count = PVStream_getCount((PVStream *)self->input_stream);
@@ -2349,14 +2541,8 @@ PVGate_process_ii(PVGate *self) {
     for (i=0; i<self->bufsize; i++) {
         self->count[i] = count[i];
         if (count[i] >= (self->size-1)) {
-            for (k=0; k<self->hsize; k++) {
-                mag = magn[self->overcount][k];
-                if (mag < thresh)
-                    self->magn[self->overcount][k] = mag * damp;
-                else
-                    self->magn[self->overcount][k] = mag;
-                self->freq[self->overcount][k] = freq[self->overcount][k];
-            }
+            PVGate_apply(self->magn[self->overcount], magn[self->overcount], thresh, damp, self->hsize);
+            memcpy(self->freq[self->overcount], freq[self->overcount], self->hsize * sizeof(MYFLT));
             self->overcount++;
             if (self->overcount >= self->olaps)
                 self->overcount = 0;
@@ -2366,8 +2552,8 @@ PVGate_process_ii(PVGate *self) {
 
 static void
 PVGate_process_ai(PVGate *self) {
-    int i, k;
-    MYFLT thresh, damp, mag;
+    int i;
+    MYFLT thresh, damp;
     MYFLT **magn = PVStream_getMagn((PVStream *)self->input_stream);
     MYFLT **freq = PVStream_getFreq((PVStream *)self->input_stream);
     int *count = PVStream_getCount((PVStream *)self->input_stream);
@@ -2387,14 +2573,8 @@ PVGate_process_ai(PVGate *self) {
         if (count[i] >= (self->size-1)) {
             thresh = rvt[i];
             thresh = MYPOW(10.0, thresh * 0.05);
-            for (k=0; k<self->hsize; k++) {
-                mag = magn[self->overcount][k];
-                if (mag < thresh)
-                    self->magn[self->overcount][k] = mag * damp;
-                else
-                    self->magn[self->overcount][k] = mag;
-                self->freq[self->overcount][k] = freq[self->overcount][k];
-            }
+            PVGate_apply(self->magn[self->overcount], magn[self->overcount], thresh, damp, self->hsize);
+            memcpy(self->freq[self->overcount], freq[self->overcount], self->hsize * sizeof(MYFLT));
             self->overcount++;
             if (self->overcount >= self->olaps)
                 self->overcount = 0;
@@ -2404,8 +2584,8 @@ PVGate_process_ai(PVGate *self) {
 
 static void
 PVGate_process_ia(PVGate *self) {
-    int i, k;
-    MYFLT thresh, damp, mag;
+    int i;
+    MYFLT thresh, damp;
     MYFLT **magn = PVStream_getMagn((PVStream *)self->input_stream);
     MYFLT **freq = PVStream_getFreq((PVStream *)self->input_stream);
     int *count = PVStream_getCount((PVStream *)self->input_stream);
@@ -2425,14 +2605,8 @@ PVGate_process_ia(PVGate *self) {
         self->count[i] = count[i];
         if (count[i] >= (self->size-1)) {
             damp = dmp[i];
-            for (k=0; k<self->hsize; k++) {
-                mag = magn[self->overcount][k];
-                if (mag < thresh)
-                    self->magn[self->overcount][k] = mag * damp;
-                else
-                    self->magn[self->overcount][k] = mag;
-                self->freq[self->overcount][k] = freq[self->overcount][k];
-            }
+            PVGate_apply(self->magn[self->overcount], magn[self->overcount], thresh, damp, self->hsize);
+            memcpy(self->freq[self->overcount], freq[self->overcount], self->hsize * sizeof(MYFLT));
             self->overcount++;
             if (self->overcount >= self->olaps)
                 self->overcount = 0;
@@ -2442,8 +2616,8 @@ PVGate_process_ia(PVGate *self) {
 
 static void
 PVGate_process_aa(PVGate *self) {
-    int i, k;
-    MYFLT thresh, damp, mag;
+    int i;
+    MYFLT thresh, damp;
     MYFLT **magn = PVStream_getMagn((PVStream *)self->input_stream);
     MYFLT **freq = PVStream_getFreq((PVStream *)self->input_stream);
     int *count = PVStream_getCount((PVStream *)self->input_stream);
@@ -2464,14 +2638,8 @@ PVGate_process_aa(PVGate *self) {
             thresh = rvt[i];
             thresh = MYPOW(10.0, thresh * 0.05);
             damp = dmp[i];
-            for (k=0; k<self->hsize; k++) {
-                mag = magn[self->overcount][k];
-                if (mag < thresh)
-                    self->magn[self->overcount][k] = mag * damp;
-                else
-                    self->magn[self->overcount][k] = mag;
-                self->freq[self->overcount][k] = freq[self->overcount][k];
-            }
+            PVGate_apply(self->magn[self->overcount], magn[self->overcount], thresh, damp, self->hsize);
+            memcpy(self->freq[self->overcount], freq[self->overcount], self->hsize * sizeof(MYFLT));
             self->overcount++;
             if (self->overcount >= self->olaps)
                 self->overcount = 0;
@@ -2770,6 +2938,412 @@ PVGate_members,                                 /* tp_members */
 PVGate_new,                                     /* tp_new */
 };
 
+/*****************/
+/** PVChain **/
+/*****************/
+/* Applies a sequence of spectral effects (transpose, gate, verb) in a
+   single pass over each analysis frame. Produces the same frames as a
+   chain of the corresponding PV objects but without the intermediate
+   magnitude/frequency buffers between stages. */
+#define PVCHAIN_MAX_OPS 16
+#define PVCHAIN_OP_TRANSPOSE 0
+#define PVCHAIN_OP_GATE 1
+#define PVCHAIN_OP_VERB 2
+
+typedef struct {
+    pyo_audio_HEAD
+    PyObject *input;
+    PVStream *input_stream;
+    PVStream *pv_stream;
+    int nops;
+    int optypes[PVCHAIN_MAX_OPS];
+    MYFLT oparg1[PVCHAIN_MAX_OPS];
+    MYFLT oparg2[PVCHAIN_MAX_OPS];
+    int size;
+    int olaps;
+    int hsize;
+    int hopsize;
+    int overcount;
+    MYFLT *buf_magn; /* scratch frame walked by the ops */
+    MYFLT *buf_freq;
+    MYFLT *tmp_magn; /* scatter destination for the transpose op */
+    MYFLT *tmp_freq;
+    MYFLT *l_magn; /* smoothing state for the verb op */
+    MYFLT *l_freq;
+    MYFLT **magn;
+    MYFLT **freq;
+    int *count;
+} PVChain;
+
+static void
+PVChain_realloc_memories(PVChain *self) {
+    int i, j, inputLatency;
+    self->hsize = self->size / 2;
+    self->hopsize = self->size / self->olaps;
+    inputLatency = self->size - self->hopsize;
+    self->overcount = 0;
+    self->buf_magn = (MYFLT *)realloc(self->buf_magn, self->hsize * sizeof(MYFLT));
+    self->buf_freq = (MYFLT *)realloc(self->buf_freq, self->hsize * sizeof(MYFLT));
+    self->tmp_magn = (MYFLT *)realloc(self->tmp_magn, self->hsize * sizeof(MYFLT));
+    self->tmp_freq = (MYFLT *)realloc(self->tmp_freq, self->hsize * sizeof(MYFLT));
+    self->l_magn = (MYFLT *)realloc(self->l_magn, self->hsize * sizeof(MYFLT));
+    self->l_freq = (MYFLT *)realloc(self->l_freq, self->hsize * sizeof(MYFLT));
+    for (i=0; i<self->hsize; i++)
+        self->l_magn[i] = self->l_freq[i] = 0.0;
+    self->magn = (MYFLT **)realloc(self->magn, self->olaps * sizeof(MYFLT *));
+    self->freq = (MYFLT **)realloc(self->freq, self->olaps * sizeof(MYFLT *));
+    for (i=0; i<self->olaps; i++) {
+        self->magn[i] = (MYFLT *)malloc(self->hsize * sizeof(MYFLT));
+        self->freq[i] = (MYFLT *)malloc(self->hsize * sizeof(MYFLT));
+        for (j=0; j<self->hsize; j++)
+            self->magn[i][j] = self->freq[i][j] = 0.0;
+    }
+    for (i=0; i<self->bufsize; i++)
+        self->count[i] = inputLatency;
+    PVStream_setFFTsize(self->pv_stream, self->size);
+    PVStream_setOlaps(self->pv_stream, self->olaps);
+    PVStream_setMagn(self->pv_stream, self->magn);
+    PVStream_setFreq(self->pv_stream, self->freq);
+    PVStream_setCount(self->pv_stream, self->count);
+}
+
+static void
+PVChain_process(PVChain *self) {
+    int i, j, k, index;
+    MYFLT mag, fre, amp, arg1, arg2, *swap;
+    MYFLT **magn = PVStream_getMagn((PVStream *)self->input_stream);
+    MYFLT **freq = PVStream_getFreq((PVStream *)self->input_stream);
+    int *count = PVStream_getCount((PVStream *)self->input_stream);
+    int size = PVStream_getFFTsize((PVStream *)self->input_stream);
+    int olaps = PVStream_getOlaps((PVStream *)self->input_stream);
+
+    if (self->size != size || self->olaps != olaps) {
+        self->size = size;
+        self->olaps = olaps;
+        PVChain_realloc_memories(self);
+    }
+
+    for (i=0; i<self->bufsize; i++) {
+        self->count[i] = count[i];
+        if (count[i] >= (self->size-1)) {
+            for (k=0; k<self->hsize; k++) {
+                self->buf_magn[k] = magn[self->overcount][k];
+                self->buf_freq[k] = freq[self->overcount][k];
+            }
+            for (j=0; j<self->nops; j++) {
+                arg1 = self->oparg1[j];
+                arg2 = self->oparg2[j];
+                switch (self->optypes[j]) {
+                    case PVCHAIN_OP_TRANSPOSE:
+                        for (k=0; k<self->hsize; k++) {
+                            self->tmp_magn[k] = 0.0;
+                            self->tmp_freq[k] = 0.0;
+                        }
+                        for (k=0; k<self->hsize; k++) {
+                            index = (int)(k * arg1);
+                            if (index < self->hsize) {
+                                self->tmp_magn[index] += self->buf_magn[k];
+                                self->tmp_freq[index] = self->buf_freq[k] * arg1;
+                            }
+                        }
+                        swap = self->buf_magn; self->buf_magn = self->tmp_magn; self->tmp_magn = swap;
+                        swap = self->buf_freq; self->buf_freq = self->tmp_freq; self->tmp_freq = swap;
+                        break;
+                    case PVCHAIN_OP_GATE:
+                        for (k=0; k<self->hsize; k++) {
+                            if (self->buf_magn[k] < arg1)
+                                self->buf_magn[k] *= arg2;
+                        }
+                        break;
+                    case PVCHAIN_OP_VERB:
+                        amp = 1.0;
+                        for (k=0; k<self->hsize; k++) {
+                            mag = self->buf_magn[k];
+                            fre = self->buf_freq[k];
+                            if (mag > self->l_magn[k]) {
+                                self->l_magn[k] = mag;
+                                self->l_freq[k] = fre;
+                            }
+                            else {
+                                self->buf_magn[k] = self->l_magn[k] = mag + (self->l_magn[k] - mag) * arg1 * amp;
+                                self->buf_freq[k] = self->l_freq[k] = fre + (self->l_freq[k] - fre) * arg1 * amp;
+                            }
+                            amp *= arg2;
+                        }
+                        break;
+                }
+            }
+            for (k=0; k<self->hsize; k++) {
+                self->magn[self->overcount][k] = self->buf_magn[k];
+                self->freq[self->overcount][k] = self->buf_freq[k];
+            }
+            self->overcount++;
+            if (self->overcount >= self->olaps)
+                self->overcount = 0;
+        }
+    }
+}
+
+static void
+PVChain_setProcMode(PVChain *self)
+{
+    self->proc_func_ptr = PVChain_process;
+}
+
+static void
+PVChain_compute_next_data_frame(PVChain *self)
+{
+    (*self->proc_func_ptr)(self);
+}
+
+static int
+PVChain_traverse(PVChain *self, visitproc visit, void *arg)
+{
+    pyo_VISIT
+    Py_VISIT(self->input);
+    Py_VISIT(self->input_stream);
+    Py_VISIT(self->pv_stream);
+    return 0;
+}
+
+static int
+PVChain_clear(PVChain *self)
+{
+    pyo_CLEAR
+    Py_CLEAR(self->input);
+    Py_CLEAR(self->input_stream);
+    Py_CLEAR(self->pv_stream);
+    return 0;
+}
+
+static void
+PVChain_dealloc(PVChain* self)
+{
+    int i;
+    pyo_DEALLOC
+    free(self->buf_magn);
+    free(self->buf_freq);
+    free(self->tmp_magn);
+    free(self->tmp_freq);
+    free(self->l_magn);
+    free(self->l_freq);
+    for(i=0; i<self->olaps; i++) {
+        free(self->magn[i]);
+        free(self->freq[i]);
+    }
+    free(self->magn);
+    free(self->freq);
+    free(self->count);
+    PVChain_clear(self);
+    self->ob_type->tp_free((PyObject*)self);
+}
+
+static PyObject *
+PVChain_setOps(PVChain *self, PyObject *arg)
+{
+    int i, n;
+    MYFLT p1, p2;
+    PyObject *op;
+    char *opname;
+
+    if (! PyList_Check(arg)) {
+        PyErr_SetString(PyExc_TypeError, "\"ops\" argument of PVChain must be a list of tuples.\n");
+        Py_RETURN_NONE;
+    }
+
+    n = PyList_Size(arg);
+    if (n > PVCHAIN_MAX_OPS)
+        n = PVCHAIN_MAX_OPS;
+
+    self->nops = 0;
+    for (i=0; i<n; i++) {
+        op = PyList_GET_ITEM(arg, i);
+        if (! PyTuple_Check(op) || PyTuple_GET_SIZE(op) < 1 || ! PyString_Check(PyTuple_GET_ITEM(op, 0))) {
+            PyErr_SetString(PyExc_TypeError, "Each operation of PVChain must be a tuple beginning with the operation name.\n");
+            Py_RETURN_NONE;
+        }
+        opname = PyString_AsString(PyTuple_GET_ITEM(op, 0));
+        p1 = p2 = 0.0;
+        if (PyTuple_GET_SIZE(op) > 1)
+            p1 = PyFloat_AsDouble(PyTuple_GET_ITEM(op, 1));
+        if (PyTuple_GET_SIZE(op) > 2)
+            p2 = PyFloat_AsDouble(PyTuple_GET_ITEM(op, 2));
+        if (strcmp(opname, "transpose") == 0) {
+            self->optypes[self->nops] = PVCHAIN_OP_TRANSPOSE;
+            self->oparg1[self->nops] = p1;
+        }
+        else if (strcmp(opname, "gate") == 0) {
+            self->optypes[self->nops] = PVCHAIN_OP_GATE;
+            self->oparg1[self->nops] = MYPOW(10.0, p1 * 0.05);
+            self->oparg2[self->nops] = p2;
+        }
+        else if (strcmp(opname, "verb") == 0) {
+            if (p1 < 0.0)
+                p1 = 0.0;
+            else if (p1 > 1.0)
+                p1 = 1.0;
+            if (p2 < 0.0)
+                p2 = 0.0;
+            else if (p2 > 1.0)
+                p2 = 1.0;
+            self->optypes[self->nops] = PVCHAIN_OP_VERB;
+            self->oparg1[self->nops] = p1 * 0.25 + 0.75;
+            self->oparg2[self->nops] = p2 * 0.003 + 0.997;
+        }
+        else {
+            PyErr_SetString(PyExc_TypeError, "Operation name of PVChain must be \"transpose\", \"gate\" or \"verb\".\n");
+            Py_RETURN_NONE;
+        }
+        self->nops++;
+    }
+
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+
+static PyObject *
+PVChain_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
+{
+    int i;
+    PyObject *inputtmp, *input_streamtmp, *opstmp=NULL;
+    PVChain *self;
+    self = (PVChain *)type->tp_alloc(type, 0);
+
+    self->nops = 0;
+    self->size = 1024;
+    self->olaps = 4;
+    INIT_OBJECT_COMMON
+    Stream_setFunctionPtr(self->stream, PVChain_compute_next_data_frame);
+    self->mode_func_ptr = PVChain_setProcMode;
+
+    static char *kwlist[] = {"input", "ops", NULL};
+
+    if (! PyArg_ParseTupleAndKeywords(args, kwds, "O|O", kwlist, &inputtmp, &opstmp))
+        Py_RETURN_NONE;
+
+    if ( PyObject_HasAttrString((PyObject *)inputtmp, "pv_stream") == 0 ) {
+        PyErr_SetString(PyExc_TypeError, "\"input\" argument of PVChain must be a PyoPVObject.\n");
+        Py_RETURN_NONE;
+    }
+    Py_INCREF(inputtmp);
+    Py_XDECREF(self->input);
+    self->input = inputtmp;
+    input_streamtmp = PyObject_CallMethod((PyObject *)self->input, "_getPVStream", NULL);
+    Py_INCREF(input_streamtmp);
+    Py_XDECREF(self->input_stream);
+    self->input_stream = (PVStream *)input_streamtmp;
+
+    self->size = PVStream_getFFTsize(self->input_stream);
+    self->olaps = PVStream_getOlaps(self->input_stream);
+
+    if (opstmp) {
+        PyObject_CallMethod((PyObject *)self, "setOps", "O", opstmp);
+    }
+
+    PyObject_CallMethod(self->server, "addStream", "O", self->stream);
+
+    MAKE_NEW_PV_STREAM(self->pv_stream, &PVStreamType, NULL);
+
+    self->count = (int *)realloc(self->count, self->bufsize * sizeof(int));
+
+    PVChain_realloc_memories(self);
+
+    (*self->mode_func_ptr)(self);
+
+    return (PyObject *)self;
+}
+
+static PyObject * PVChain_getServer(PVChain* self) { GET_SERVER };
+static PyObject * PVChain_getStream(PVChain* self) { GET_STREAM };
+static PyObject * PVChain_getPVStream(PVChain* self) { GET_PV_STREAM };
+
+static PyObject * PVChain_play(PVChain *self, PyObject *args, PyObject *kwds) { PLAY };
+static PyObject * PVChain_stop(PVChain *self) { STOP };
+
+static PyObject *
+PVChain_setInput(PVChain *self, PyObject *arg)
+{
+	PyObject *inputtmp, *input_streamtmp;
+
+    inputtmp = arg;
+    if ( PyObject_HasAttrString((PyObject *)inputtmp, "pv_stream") == 0 ) {
+        PyErr_SetString(PyExc_TypeError, "\"input\" argument of PVChain must be a PyoPVObject.\n");
+        Py_RETURN_NONE;
+    }
+
+    Py_INCREF(inputtmp);
+    Py_XDECREF(self->input);
+    self->input = inputtmp;
+    input_streamtmp = PyObject_CallMethod((PyObject *)self->input, "_getPVStream", NULL);
+    Py_INCREF(input_streamtmp);
+    Py_XDECREF(self->input_stream);
+    self->input_stream = (PVStream *)input_streamtmp;
+
+	Py_INCREF(Py_None);
+	return Py_None;
+}
+
+static PyMemberDef PVChain_members[] = {
+{"server", T_OBJECT_EX, offsetof(PVChain, server), 0, "Pyo server."},
+{"stream", T_OBJECT_EX, offsetof(PVChain, stream), 0, "Stream object."},
+{"pv_stream", T_OBJECT_EX, offsetof(PVChain, pv_stream), 0, "Phase Vocoder Stream object."},
+{"input", T_OBJECT_EX, offsetof(PVChain, input), 0, "FFT sound object."},
+{NULL}  /* Sentinel */
+};
+
+static PyMethodDef PVChain_methods[] = {
+{"getServer", (PyCFunction)PVChain_getServer, METH_NOARGS, "Returns server object."},
+{"_getStream", (PyCFunction)PVChain_getStream, METH_NOARGS, "Returns stream object."},
+{"_getPVStream", (PyCFunction)PVChain_getPVStream, METH_NOARGS, "Returns pvstream object."},
+{"setInput", (PyCFunction)PVChain_setInput, METH_O, "Sets a new input object."},
+{"setOps", (PyCFunction)PVChain_setOps, METH_O, "Sets the list of spectral operations."},
+{"play", (PyCFunction)PVChain_play, METH_VARARGS|METH_KEYWORDS, "Starts computing without sending sound to soundcard."},
+{"stop", (PyCFunction)PVChain_stop, METH_NOARGS, "Stops computing."},
+{NULL}  /* Sentinel */
+};
+
+PyTypeObject PVChainType = {
+PyObject_HEAD_INIT(NULL)
+0,                                              /*ob_size*/
+"_pyo.PVChain_base",                                   /*tp_name*/
+sizeof(PVChain),                                 /*tp_basicsize*/
+0,                                              /*tp_itemsize*/
+(destructor)PVChain_dealloc,                     /*tp_dealloc*/
+0,                                              /*tp_print*/
+0,                                              /*tp_getattr*/
+0,                                              /*tp_setattr*/
+0,                                              /*tp_compare*/
+0,                                              /*tp_repr*/
+0,                                              /*tp_as_number*/
+0,                                              /*tp_as_sequence*/
+0,                                              /*tp_as_mapping*/
+0,                                              /*tp_hash */
+0,                                              /*tp_call*/
+0,                                              /*tp_str*/
+0,                                              /*tp_getattro*/
+0,                                              /*tp_setattro*/
+0,                                              /*tp_as_buffer*/
+Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE | Py_TPFLAGS_HAVE_GC, /*tp_flags*/
+"PVChain objects. Applies a chain of spectral effects in a single pass.",           /* tp_doc */
+(traverseproc)PVChain_traverse,                  /* tp_traverse */
+(inquiry)PVChain_clear,                          /* tp_clear */
+0,                                              /* tp_richcompare */
+0,                                              /* tp_weaklistoffset */
+0,                                              /* tp_iter */
+0,                                              /* tp_iternext */
+PVChain_methods,                                 /* tp_methods */
+PVChain_members,                                 /* tp_members */
+0,                                              /* tp_getset */
+0,                                              /* tp_base */
+0,                                              /* tp_dict */
+0,                                              /* tp_descr_get */
+0,                                              /* tp_descr_set */
+0,                                              /* tp_dictoffset */
+0,                          /* tp_init */
+0,                                              /* tp_alloc */
+PVChain_new,                                     /* tp_new */
+};
+
 /*****************/
 /** PVCross **/
 /*****************/